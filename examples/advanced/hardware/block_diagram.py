@@ -1,9 +1,11 @@
 import time
+from multiprocessing import shared_memory
 from pathlib import Path
 
 import numpy as np
 import parameters as prm
 from emioapi import EmioMotors
+from realtime import set_realtime_priority
 
 from pySimBlocks.project import load_simulator_from_project
 from pySimBlocks.real_time import RealTimeRunner
@@ -13,38 +15,57 @@ try:
 except Exception:
     BASE_DIR = Path("")
 
+DT_LOG_EVERY = 600
+
 
 # ------------------------------------------------------------------------------
 # Process
 # ------------------------------------------------------------------------------
-def process_block_diagram(shared_markers_pos, shared_ref_ol, shared_ref_cl, 
+def process_block_diagram(shm_markers_name, shared_markers_idx, shared_ref_ol, shared_ref_cl,
                           shared_control_mode, shared_update, 
                           event_frame, event_measure):
     """pySimBlocks runner process.
     """
+    set_realtime_priority()
     init_angles = np.array([0.7, 0, 0.7, 0])
     motors = setup_motors(init_angles)
 
     # init pySimBlocks runner
     runner = setup_block_diagram()
 
+    # camera double buffer, read without lock
+    shm_markers_pos = shared_memory.SharedMemory(name=shm_markers_name)
+    markers_buffers = np.ndarray((2, 2 * prm.nb_markers), dtype=np.float64,
+                                 buffer=shm_markers_pos.buf)
+
     # Initialize variables
     measure = np.zeros((prm.nb_markers * 2, 1))
     ref_ol = np.zeros((2, 1))
     ref_cl = np.zeros((2, 1))
     control_mode = np.zeros((1, 1))
     command = np.zeros((2, 1))
+    motors_cmd = [0.] * 4
+
+    # the buffers above are updated in place, so the same inputs mapping is
+    # passed to the runner at every tick
+    inputs = {
+        "Camera": measure,
+        "Ref_ol": ref_ol,
+        "Ref_cl": ref_cl,
+        "Mode": control_mode
+    }
 
     # Initial time for dt measurement
     t = time.perf_counter()
     dt_init = 1/60
-    dt_list = []
+    dt_sum = 0.
+    dt_n = 0
 
     while True:
         event_frame.wait()
         event_frame.clear()
 
-        send_motors_command(motors, command, init_angles)
+        send_motors_command(motors, command, init_angles, motors_cmd)
 
         event_measure.wait()
         event_measure.clear()
@@ -57,32 +78,26 @@ def process_block_diagram(shared_markers_pos, shared_ref_ol, shared_ref_cl,
             t2 = time.perf_counter()
             dt = t2 - t
             t = t2
-        dt_list.append(dt)
+        dt_sum += dt
+        dt_n += 1
+        if dt_n % DT_LOG_EVERY == 0:
+            print(f"Mean dt: {1000 * dt_sum / dt_n:.2f} ms over {dt_n} ticks")
 
         # data from camera
-        with shared_markers_pos.get_lock():
-            measure[:, 0] = shared_markers_pos[:]
-
-        with shared_update.get_lock():
-            if shared_update.value:
-                with shared_ref_ol.get_lock():
-                    ref_ol[:, 0] = shared_ref_ol[:]
-                with shared_ref_cl.get_lock():
-                    ref_cl[:, 0] = shared_ref_cl[:]
-                with shared_control_mode.get_lock():
-                    control_mode[0,0] = shared_control_mode.value
-                shared_update.value = False
-
-        outs = runner.tick(
-            inputs={
-                "Camera": measure,
-                "Ref_ol": ref_ol,
-                "Ref_cl": ref_cl,
-                "Mode": control_mode
-            },
-            dt=dt,
-            pace=False
-        )
+        measure[:, 0] = markers_buffers[shared_markers_idx.value]
+
+        # the flag is cleared before reading so that an update pushed by the
+        # GUI meanwhile is picked up at the next tick
+        if shared_update.value:
+            shared_update.value = False
+            with shared_ref_ol.get_lock():
+                ref_ol[:, 0] = shared_ref_ol[:]
+            with shared_ref_cl.get_lock():
+                ref_cl[:, 0] = shared_ref_cl[:]
+            with shared_control_mode.get_lock():
+                control_mode[0,0] = shared_control_mode.value
+
+        outs = runner.tick(inputs=inputs, dt=dt, pace=False)
         command = outs["Cmd"]
 
 
@@ -116,15 +131,22 @@ def setup_motors(init_angles=[0, 0, 0, 0]):
     return motors
 
 # -------------------------------------------------------
-def send_motors_command(motors, command, init_angles=np.array([0, 0, 0, 0])):
-    command = command.flatten()
-    motors.angles = [command[0] + init_angles[0], init_angles[1],
-                     command[1] + init_angles[2], init_angles[3]]
+def send_motors_command(motors, command, init_angles=np.array([0, 0, 0, 0]),
+                        motors_cmd=None):
+    # motors_cmd: optional 4-element list reused from one call to the next
+    if motors_cmd is None:
+        motors_cmd = [0.] * 4
+    motors_cmd[0] = command[0, 0] + init_angles[0]
+    motors_cmd[1] = init_angles[1]
+    motors_cmd[2] = command[1, 0] + init_angles[2]
+    motors_cmd[3] = init_angles[3]
+    motors.angles = motors_cmd
 
 # -------------------------------------------------------
 def get_motors_position(motors, init_angles=np.array([0, 0, 0, 0])):
-    motors_pos = np.array(motors.angles) - init_angles
-    return motors_pos[[0, 2]].reshape((2, 1))
+    angles = motors.angles
+    return np.array([[angles[0] - init_angles[0]],
+                     [angles[2] - init_angles[2]]])
 
 # ------------------------------------------------------------------------------
 # BLOCK DIAGRAM FUNCTIONS
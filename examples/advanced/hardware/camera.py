@@ -1,22 +1,34 @@
 import json
+from multiprocessing import shared_memory
 
 import cv2 as cv
 import numpy as np
 import parameters as prm
 from emioapi._depthcamera import DepthCamera
+from realtime import set_realtime_priority
+
+
+DROP_LOG_EVERY = 60
+MARKERS_INDICES = np.array([1, 2, 4, 5, 7, 8])
 
 
 # ------------------------------------------------------------------------------
 # Process
 # ------------------------------------------------------------------------------
-def process_camera(shared_markers_pos, shared_start, 
+def process_camera(shm_markers_name, shared_markers_idx, shared_start,
                    event_frame, event_measure):
     """Update tracker position."""
+    set_realtime_priority()
     camera = setup_camera()
 
+    shm_markers_pos = shared_memory.SharedMemory(name=shm_markers_name)
+    markers_buffers = np.ndarray((2, 2 * prm.nb_markers), dtype=np.float64,
+                                 buffer=shm_markers_pos.buf)
+
     init_pos = np.zeros((2 * prm.nb_markers))
     pos = np.zeros((2 * prm.nb_markers))
     start = False
+    dropped = 0
 
     while True:
         # get frame from camera
@@ -29,21 +41,31 @@ def process_camera(shared_markers_pos, shared_start,
         pos = process_frame(camera, pos)
 
         if start:
-            pos -= init_pos
-            with shared_markers_pos.get_lock():
-                shared_markers_pos[:] = pos
+            # the block diagram did not consume the previous measure: it is
+            # overwritten so only the newest frame is ever processed
+            if event_measure.is_set():
+                dropped += 1
+                if dropped % DROP_LOG_EVERY == 0:
+                    print(f"Camera: {dropped} stale measures dropped")
+
+            # fill the half not being read, then publish it
+            write_idx = 1 - shared_markers_idx.value
+            np.subtract(pos, init_pos, out=markers_buffers[write_idx])
+            shared_markers_idx.value = write_idx
             event_measure.set()
 
         else:
             init_pos = pos
-            with shared_start.get_lock():
-                start = shared_start.value
+            start = shared_start.value
 
         k = cv.waitKey(1)
         if k == ord('q'):
             camera.quit()
             break
 
+    del markers_buffers
+    shm_markers_pos.close()
+
 
 # ------------------------------------------------------------------------------
 # Helpers
@@ -64,30 +86,36 @@ def setup_camera():
     return camera
 
 # -------------------------------------------------------
-def pixel_to_mm(points, depth):
-    ppx, ppy = 319.475, 240.962
-    fx, fy = 382.605, 382.605
-    points[:, 0] = ((points[:, 0] - ppx) / fx) * depth
-    points[:, 1] = ((points[:, 1] - ppy) / fy) * depth
-    points = np.column_stack((points[:, 2], -points[:, 1], points[:, 0]))
-    return points.copy()
+# Camera intrinsics and marker depth (mm)
+PPX, PPY = 319.475, 240.962
+FX, FY = 382.605, 382.605
+DEPTH = 249
+
+# Affine map from (u, v, z) pixel rows to SOFA-ordered (z, -y, x) mm rows
+PIX2MM = np.array([[0., 0., 1.],
+                   [0., -DEPTH / FY, 0.],
+                   [DEPTH / FX, 0., 0.]])
+PIX2MM_OFFSET = np.array([0., PPY * DEPTH / FY, -PPX * DEPTH / FX])
+
+def pixel_to_mm(points):
+    return points @ PIX2MM.T + PIX2MM_OFFSET
 
 # -------------------------------------------------------
 def camera_to_sofa_order(points):
-    i_ymax = np.argmax(points[:, 1])
-    i_rest = [i for i in range(prm.nb_markers) if i != i_ymax]
-    i_sorted_z = sorted(i_rest, key=lambda i: points[i, 2])
-    new_order = [i_sorted_z[1], i_sorted_z[0], i_ymax]
-    return points[new_order].flatten()
+    # nb_markers is 3: the marker with the highest y goes last, the two
+    # others are ordered by decreasing z
+    i_ymax = int(np.argmax(points[:, 1]))
+    i_a, i_b = (i_ymax + 1) % 3, (i_ymax + 2) % 3
+    if points[i_a, 2] < points[i_b, 2]:
+        i_a, i_b = i_b, i_a
+    return points[[i_a, i_b, i_ymax]].ravel()
 
 # -------------------------------------------------------
 def process_frame(camera, last_pos):
-    indices = [1, 2, 4, 5, 7, 8]
     camera.process_frame()
     if len(camera.trackers_pos) == prm.nb_markers:
-        pos = np.array(camera.trackers_camera).reshape(prm.nb_markers, 3).copy()
-        pos = pos.astype(np.float64)
-        pos = pixel_to_mm(pos, 249)
+        pos = np.asarray(camera.trackers_camera, dtype=np.float64).reshape(prm.nb_markers, 3)
+        pos = pixel_to_mm(pos)
         markers_pos = camera_to_sofa_order(pos)
-        return markers_pos[indices]
+        return markers_pos[MARKERS_INDICES]
     return last_pos
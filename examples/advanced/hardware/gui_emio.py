@@ -164,8 +164,7 @@ class EmioRealTimeGUI:
         if not self.start:
             self.start = True
             self.label_info["Start"].config(text="Start: True")
-            with self.shared_start.get_lock():
-                self.shared_start.value = self.start
+            self.shared_start.value = self.start
             mode = prm.ControlMode(0)
             self._push_current_commands(mode)
 
@@ -187,8 +186,7 @@ class EmioRealTimeGUI:
             return
         with self.shared_control_mode.get_lock():
             self.shared_control_mode.value = int(self.control_mode)
-        with self.shared_update.get_lock():
-            self.shared_update.value = True
+        self.shared_update.value = True
 
         if self.control_mode == prm.ControlMode.OPEN_LOOP:
             self.label_info["Control"].config(text="Control: Open Loop")
@@ -227,5 +225,4 @@ class EmioRealTimeGUI:
                 self.shared_ref_cl[0] = ref[0]
                 self.shared_ref_cl[1] = ref[1]
 
-        with self.shared_update.get_lock():
-            self.shared_update.value = True
+        self.shared_update.value = True
@@ -1,5 +1,8 @@
 import time
 import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
 
 import parameters as prm
 from block_diagram import process_block_diagram
@@ -10,14 +13,18 @@ from gui_emio import process_gui
 def main():
 
     # shared variables
-    shared_markers_pos = multiprocessing.Array("d", 2 * prm.nb_markers * [0.])
+    # markers position: double buffer written by the camera, the index of
+    # the latest complete half is published last so no lock is needed
+    shm_markers_pos = shared_memory.SharedMemory(
+        create=True, size=2 * 2 * prm.nb_markers * np.dtype(np.float64).itemsize)
+    shared_markers_idx = multiprocessing.Value("i", 0, lock=False)
     shared_ref_ol = multiprocessing.Array("d", 2 * [0.0])
     shared_ref_cl = multiprocessing.Array("d", 2 * [0.0])
 
     # shared bool
-    shared_start = multiprocessing.Value("b", False)
+    shared_start = multiprocessing.Value("b", False, lock=False)
     shared_control_mode = multiprocessing.Value("i", 0)
-    shared_update = multiprocessing.Value("b", False)
+    shared_update = multiprocessing.Value("b", False, lock=False)
 
     # shared event
     event_frame = multiprocessing.Event()
@@ -25,7 +32,7 @@ def main():
 
     # Create processes
     p1 = multiprocessing.Process(target=process_camera, args=(
-        shared_markers_pos, shared_start, 
+        shm_markers_pos.name, shared_markers_idx, shared_start,
         event_frame, event_measure))
 
     p2 = multiprocessing.Process(target=process_gui, args=(
@@ -33,7 +40,7 @@ def main():
         shared_start, shared_control_mode, shared_update))
 
     p3 = multiprocessing.Process(target=process_block_diagram, args=(
-        shared_markers_pos, shared_ref_ol, shared_ref_cl, 
+        shm_markers_pos.name, shared_markers_idx, shared_ref_ol, shared_ref_cl,
         shared_control_mode, shared_update, event_frame, event_measure))
 
     p1.start()
@@ -52,6 +59,9 @@ def main():
         p2.join()
         p3.join()
 
+        shm_markers_pos.close()
+        shm_markers_pos.unlink()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,26 @@
+import ctypes
+import ctypes.util
+import os
+
+MCL_CURRENT = 1
+MCL_FUTURE = 2
+
+
+def set_realtime_priority(priority=50):
+    """Run the calling process under SCHED_FIFO with its memory locked.
+
+    Both settings need privileges (root or CAP_SYS_NICE / CAP_IPC_LOCK); when
+    they are not granted the process keeps the default scheduling and a
+    warning is printed.
+    """
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+    except (AttributeError, PermissionError, OSError) as e:
+        print(f"Real-time scheduling not enabled: {e}")
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if libc.mlockall(MCL_CURRENT | MCL_FUTURE) != 0:
+            raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+    except (AttributeError, OSError) as e:
+        print(f"Memory locking not enabled: {e}")
@@ -22,11 +22,15 @@ class FingerController(SofaPysimBlocksController):
         self.inputs = { "cable": None }
         self.outputs = { "tip": None, "measure": None }
 
+        # Input conversion to Sofa format, resolved on the first input
+        self._convert = None
+
 
     def get_outputs(self):
-        tip = self.mo.position[self.tip_index].copy()
-        self.outputs["tip"] = np.asarray(tip).reshape(-1, 1)
-        self.outputs["measure"] = np.asarray(tip[1]).reshape(-1, 1)
+        # single copy out of the SOFA data, measure is a view of its y row
+        tip = np.array(self.mo.position[self.tip_index], dtype=float).reshape(-1, 1)
+        self.outputs["tip"] = tip
+        self.outputs["measure"] = tip[1:2]
 
     def set_inputs(self):
         # 1. READ INPUT -------------------------------------
@@ -35,15 +39,20 @@ class FingerController(SofaPysimBlocksController):
         # Safe default for first initialization call
         if val is None:
             # ↓↓↓ Valeur par défaut pour l’initialisation
-            val = 0.0
+            self.actuator.value = [0.0]
+            return
 
         # Convert input to Sofa format
-        if isinstance(val, np.ndarray):
-            processed = val.flatten().tolist()
-        elif isinstance(val, (list, tuple)):
-            processed = val
-        else:
-            processed = [float(val)]
+        if self._convert is None:
+            self._convert = self._make_converter(val)
 
         # Apply to actuator
-        self.actuator.value = processed
+        self.actuator.value = self._convert(val)
+
+    @staticmethod
+    def _make_converter(val):
+        if isinstance(val, np.ndarray):
+            return lambda v: v.flatten().tolist()
+        if isinstance(val, (list, tuple)):
+            return lambda v: v
+        return lambda v: [float(v)]
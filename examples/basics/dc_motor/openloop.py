@@ -1,3 +1,4 @@
+import os
 import numpy as np
 import matplotlib.pyplot as plt
 from pySimBlocks import Model, Simulator, SimulationConfig
@@ -48,6 +49,18 @@ def main():
     print("Open-Loop DC Motor Response:")
     print(w[-5:].flatten())
 
+    # Open-loop LTI: cross-check against scipy's dlsim when available
+    try:
+        from scipy.signal import dlsim
+    except ImportError:
+        dlsim = None
+    if dlsim is not None:
+        _, w_lti, _ = dlsim((A, B, C, np.zeros((1, 1)), dt), u, t=time.ravel())
+        print("Max error block diagram vs scipy dlsim: ", np.max(np.abs(w - w_lti.ravel())))
+
+    if os.environ.get("PYSIMBLOCKS_HEADLESS"):
+        return
+
     plt.figure()
     plt.step(time, w, '--b', label="Motor Speed (rad/s)")
     plt.step(time, u, '--g', label="Control Input (V)")
@@ -0,0 +1,90 @@
+import os
+import numpy as np
+import matplotlib.pyplot as plt
+from pySimBlocks import Model, Simulator, SimulationConfig
+from pySimBlocks.blocks.sources import Step
+from pySimBlocks.blocks.systems import LinearStateSpace
+from pySimBlocks.blocks.operators import Sum, Gain, DiscreteIntegrator
+
+from pi import manual
+
+
+def batch(A, B, C, Kp, Ki, dt, T):
+    """Simulate one PI loop per column of the (1, N) gain rows Kp and Ki.
+
+    Every signal is (rows, N): the N closed loops run side by side in a single
+    simulation, the motor state being updated with one matrix product.
+    """
+    n_runs = Kp.shape[1]
+
+    ref = Step("ref", start_time=1., value_before=0., value_after=1.)
+    motor = LinearStateSpace("motor", A, B, C, x0=np.zeros((A.shape[0], n_runs)))
+    error = Sum("error", signs="+-")
+    kp = Gain("Kp", Kp)
+    ki = Gain("Ki", Ki)
+    integrator = DiscreteIntegrator("integrator")
+    sum = Sum("sum", "++")
+
+    model = Model("DC Motor Control (batch)")
+    for block in [ref, error, kp, integrator, ki, sum, motor]:
+        model.add_block(block)
+    model.connect("ref", "out", "error", "in1")
+    model.connect("motor", "y", "error", "in2")
+    model.connect("error", "out", "Kp", "in")
+    model.connect("error", "out", "Ki", "in")
+    model.connect("Kp", "out", "sum", "in1")
+    model.connect("Ki", "out", "integrator", "in")
+    model.connect("integrator", "out", "sum", "in2")
+    model.connect("sum", "out", "motor", "u")
+
+    sim_cfg = SimulationConfig(dt, T)
+    sim = Simulator(model, sim_cfg, verbose=False)
+    sim.run(logging=["motor.outputs.y", "sum.outputs.out"])
+
+    time = sim.get_data("time")
+    w = sim.get_data("motor.outputs.y")[:, 0, :]
+    u = sim.get_data("sum.outputs.out")[:, 0, :]
+
+    return time, w, u
+
+def main():
+    # DC Motor parameters
+    R = 0.1
+    L = 0.5
+    J = 0.01
+    K = 0.1
+    a = 0.001
+
+    # One PI loop per Kp value
+    Kp = np.linspace(0.0005, 0.002, 8).reshape(1, -1)
+    Ki = np.full_like(Kp, 0.02)
+
+    # Simulation parameters
+    dt = 0.01
+    T = 30.
+
+    # State-space matrices
+    A = np.array([[1-dt*R/L, -dt*K/L], [dt*K/J, 1-dt*a/J]])
+    B = np.array([[dt/L], [0]])
+    C = np.array([[0, 1]])
+
+    time, w, u = batch(A, B, C, Kp, Ki, dt, T)
+
+    _, _, w_single, _, _, _ = manual(A, B, C, Kp[:, [0]], Ki[:, [0]], dt, T)
+    print("Max error batch vs single run: ", np.max(np.abs(w[:, 0] - w_single)))
+
+    if os.environ.get("PYSIMBLOCKS_HEADLESS"):
+        return
+
+    plt.figure()
+    for j in range(Kp.shape[1]):
+        plt.step(time, w[:, j], label=f"Kp = {Kp[0, j]:.4f}", where='post')
+    plt.xlabel("Time (s)")
+    plt.ylabel("Speed (rad/s)")
+    plt.title("DC Motor PI Speed Response (batch)")
+    plt.legend()
+    plt.grid()
+    plt.show()
+
+if __name__ == "__main__":
+    main()
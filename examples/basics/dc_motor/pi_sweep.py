@@ -0,0 +1,83 @@
+import os
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from pySimBlocks import Simulator, SimulationConfig
+
+from pi import build_model
+
+
+# DC Motor parameters
+R = 0.1
+L = 0.5
+J = 0.01
+K = 0.1
+a = 0.001
+
+# Simulation parameters
+dt = 0.01
+T = 30.
+
+# State-space matrices
+A = np.array([[1-dt*R/L, -dt*K/L], [dt*K/J, 1-dt*a/J]])
+B = np.array([[dt/L], [0]])
+C = np.array([[0, 1]])
+
+
+# One model and simulator per worker process, reused for every grid point
+_sim = None
+
+
+def scenario(params):
+    """Run the PI closed loop for one (Kp, Ki) point and return (w, u)."""
+    global _sim
+    if _sim is None:
+        model = build_model(A, B, C, np.zeros((1, 1)), np.zeros((1, 1)))
+        _sim = Simulator(model, SimulationConfig(dt, T), verbose=False)
+
+    _sim.model.set_params({"Kp.gain": params["Kp"], "Ki.gain": params["Ki"]})
+    _sim.run(logging=["motor.outputs.y", "sum.outputs.out"])
+    w = _sim.get_data("motor.outputs.y").squeeze()
+    u = _sim.get_data("sum.outputs.out").squeeze()
+    return w, u
+
+
+def run_sweep(scenario_fn, params_grid, n_workers=None):
+    """Run scenario_fn on every point of the cartesian product of params_grid.
+
+    Each simulation is independent, so points are dispatched to a process
+    pool. Results are returned in the order of the grid points.
+    """
+    names = list(params_grid)
+    points = [dict(zip(names, values)) for values in itertools.product(*params_grid.values())]
+    with ProcessPoolExecutor(max_workers=n_workers or os.cpu_count()) as executor:
+        results = list(executor.map(scenario_fn, points))
+    return points, results
+
+
+def main():
+    params_grid = {
+        "Kp": np.linspace(0.0005, 0.002, 4),
+        "Ki": np.linspace(0.01, 0.04, 4),
+    }
+
+    points, results = run_sweep(scenario, params_grid)
+
+    rows = []
+    for p, (w, u) in zip(points, results):
+        iae = dt * np.sum(np.abs(1.0 - w[int(1. / dt):]))
+        overshoot = max(np.max(w) - 1.0, 0.0)
+        rows.append([p["Kp"], p["Ki"], iae, overshoot, np.max(np.abs(u))])
+
+    rows = np.array(rows)
+    np.savetxt("pi_sweep.csv", rows, delimiter=",",
+               header="Kp,Ki,iae,overshoot,u_max", comments="")
+
+    best = rows[np.argmin(rows[:, 2])]
+    print(f"{len(rows)} simulations written to pi_sweep.csv")
+    print(f"Lowest IAE: Kp={best[0]:.5f}, Ki={best[1]:.5f}, IAE={best[2]:.4f}")
+
+if __name__ == "__main__":
+    main()
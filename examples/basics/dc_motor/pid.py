@@ -1,3 +1,4 @@
+import os
 import numpy as np
 import matplotlib.pyplot as plt
 from pySimBlocks import Model, Simulator, SimulationConfig
@@ -66,6 +67,28 @@ def manual(A, B, C, Kp, Ki, Kd, dt, T):
     return time, r, w, u, p_term, i_term, d_term
 
 
+def fused(A, B, C, Kp, Ki, Kd, dt, time):
+    """Same closed loop as `manual`, written as one NumPy loop over time."""
+    kp, ki, kd = float(Kp[0, 0]), float(Ki[0, 0]), float(Kd[0, 0])
+    x = np.zeros((A.shape[0], 1))
+    xi = 0.0
+    e_prev = None
+    w = np.empty(len(time))
+    u = np.empty(len(time))
+
+    for k, t in enumerate(time.ravel()):
+        r = 1.0 if t >= 1.0 else 0.0
+        w[k] = (C @ x).item()
+        e = r - w[k]
+        d = 0.0 if e_prev is None else kd * (e - e_prev) / dt
+        u[k] = kp * e + d + xi
+        x = A @ x + B * u[k]
+        xi += dt * ki * e
+        e_prev = e
+
+    return w, u
+
+
 def main():
     # DC Motor parameters
     R = 0.1
@@ -90,6 +113,11 @@ def main():
     time_man, r_man, w_man, u_man, p_term, i_term, d_term = manual(
         A, B, C, Kp, Ki, Kd, dt, T
     )
+    w_fused, u_fused = fused(A, B, C, Kp, Ki, Kd, dt, time_man)
+    print("Max error block diagram vs fused loop: ", np.max(np.abs(w_man - w_fused)))
+
+    if os.environ.get("PYSIMBLOCKS_HEADLESS"):
+        return
 
     plt.figure()
     plt.step(time_man, r_man, ":r", label="Reference (Manual)", where="post")
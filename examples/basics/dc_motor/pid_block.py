@@ -1,3 +1,4 @@
+import os
 import numpy as np
 import matplotlib.pyplot as plt
 from pySimBlocks import Model, Simulator, SimulationConfig
@@ -67,6 +68,9 @@ def main():
     time_pid, r_pid, w_pid, u_pid = pid(A, B, C, Kp, Ki, Kd, dt, T)
 
 
+    if os.environ.get("PYSIMBLOCKS_HEADLESS"):
+        return
+
     plt.figure()
     plt.step(time_pid, r_pid, '--r', label="Reference (PID)", where='post')
     plt.step(time_pid, w_pid, '--b', label="Motor Speed (PID)", where='post')
@@ -1,3 +1,4 @@
+import os
 import numpy as np
 import matplotlib.pyplot as plt
 from pySimBlocks import Model, Simulator, SimulationConfig
@@ -112,9 +113,11 @@ def main():
     time_pid, r_pid, w_pid, u_pid = pid(A, B, C, Kp, Ki, Kd, dt, T)
     time_man, r_man, w_man, u_man = manual(A, B, C, Kp, Ki, Kd, dt, T)
 
-    error = np.linalg.norm(w_pid - w_man)
+    diff = w_pid - w_man
+    error = np.sqrt(np.dot(diff, diff))
+    np.abs(diff, out=diff)
     print(f"Error between PID block and manual implementation: {error:.6f}")
-    print("Mean Error: ", np.mean(np.abs(w_pid - w_man)))
+    print("Mean Error: ", diff.mean())
 
     print("Time: ", time_pid[98:105].flatten())
     print("PID w: ", w_pid[98:105].flatten())
@@ -122,6 +125,9 @@ def main():
     print("PID u: ", u_pid[98:105].flatten())
     print("Man u: ", u_man[98:105].flatten())
 
+    if os.environ.get("PYSIMBLOCKS_HEADLESS"):
+        return
+
     plt.figure()
     plt.step(time_pid, r_pid, '--r', label="Reference (PID)", where='post')
     plt.step(time_pid, w_pid, '--b', label="Motor Speed (PID)", where='post')
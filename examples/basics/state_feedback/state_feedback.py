@@ -63,8 +63,6 @@ def main():
     )
 
     # --- 6. Inspect / print some results ---
-    length = len(logs["plant.outputs.y"])
-
     t = sim.get_data("time")
     r = sim.get_data("ref.outputs.out").squeeze()
     y = sim.get_data("plant.outputs.y").squeeze()
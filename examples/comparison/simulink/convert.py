@@ -3,16 +3,12 @@ import numpy as np
 
 filename = "simulation.csv"
 
-# Lecture du CSV
+# Titres : première ligne lue avec csv (gère les en-têtes entre guillemets)
 with open(filename, "r") as f:
-    reader = csv.reader(f)
-    rows = list(reader)
+    titles = next(csv.reader(f))
 
-# Titres
-titles = rows[0]
-
-# Données converties en float
-data = np.array(rows[1:], dtype=float)
+# Données parsées directement en float
+data = np.loadtxt(filename, delimiter=",", skiprows=1, ndmin=2)
 
 # Construction dynamique du dictionnaire pour savez
 save_dict = {"titles": np.array(titles)}
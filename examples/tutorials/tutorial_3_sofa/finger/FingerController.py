@@ -24,9 +24,10 @@ class FingerController(SofaPysimBlocksController):
 
 
     def get_outputs(self):
-        tip = self.mo.position[self.tip_index].copy()
-        self.outputs["tip"] = np.asarray(tip).reshape(-1, 1)
-        self.outputs["measure"] = np.asarray(tip[1]).reshape(-1, 1)
+        # single copy out of the SOFA data, measure is a view of its y row
+        tip = np.array(self.mo.position[self.tip_index], dtype=float).reshape(-1, 1)
+        self.outputs["tip"] = tip
+        self.outputs["measure"] = tip[1:2]
 
     def set_inputs(self):
         val = self.inputs["cable"]
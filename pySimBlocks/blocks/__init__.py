@@ -18,11 +18,11 @@
 #  Authors: see Authors.txt
 # ******************************************************************************
 
-from pySimBlocks.blocks.controllers import Pid, StateFeedback
+from pySimBlocks.blocks.controllers import BatchedPid, Pid, StateFeedback
 from pySimBlocks.blocks.interfaces import ExternalInput, ExternalOutput
 from pySimBlocks.blocks.observers import Luenberger
 from pySimBlocks.blocks.operators import (
-    DeadZone, Delay, DiscreteDerivator, DiscreteIntegrator,
+    DeadZone, Delay, DelayedDerivator, DiscreteDerivator, DiscreteIntegrator,
     Gain, Mux, Product, RateLimiter, Saturation, Sum, ZeroOrderHold
 )
 from pySimBlocks.blocks.sources import (
@@ -36,6 +36,7 @@ from pySimBlocks.blocks.sources import (
 from pySimBlocks.blocks.systems import LinearStateSpace, PolytopicStateSpace
 
 __all__ = [
+    "BatchedPid",
     "Pid",
     "StateFeedback",
 
@@ -46,6 +47,7 @@ __all__ = [
 
     "DeadZone",
     "Delay",
+    "DelayedDerivator",
     "DiscreteDerivator",
     "DiscreteIntegrator",
     "Gain",
@@ -18,10 +18,12 @@
 #  Authors: see Authors.txt
 # ******************************************************************************
 
+from pySimBlocks.blocks.controllers.batched_pid import BatchedPid
 from pySimBlocks.blocks.controllers.pid import Pid
 from pySimBlocks.blocks.controllers.state_feedback import StateFeedback
 
 __all__ = [
+    "BatchedPid",
     "Pid",
     "StateFeedback"
 ]
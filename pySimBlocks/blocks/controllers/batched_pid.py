@@ -0,0 +1,325 @@
+# ******************************************************************************
+#                                  pySimBlocks
+#                     Copyright (c) 2026 Université de Lille & INRIA
+# ******************************************************************************
+#  This program is free software: you can redistribute it and/or modify it
+#  under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or (at your
+#  option) any later version.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+#  FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+#  for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ******************************************************************************
+#  Authors: see Authors.txt
+# ******************************************************************************
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from pySimBlocks.core.block import Block, FLOAT64
+
+
+class BatchedPid(Block):
+    """Bank of independent discrete-time PID controllers.
+
+    Runs K SISO PID loops side by side on a (K,1) error vector, with the
+    same control law and options as :class:`Pid`. Channel k computes
+    ``u[k]`` from ``e[k]`` only; the K loops are evaluated with one NumPy
+    call per term instead of one block per loop.
+
+    Gains and saturation bounds are either scalar (shared by all channels)
+    or (K,1) vectors (one value per channel). The number of channels K is
+    taken from the first non-scalar parameter, or from the first input when
+    every parameter is scalar.
+
+    Attributes:
+        controller: Active control mode (``"P"``, ``"I"``, ``"PI"``,
+            ``"PD"``, or ``"PID"``).
+        integration_method: Integration scheme for the I term
+            (``"euler forward"`` or ``"euler backward"``).
+        Kp: Proportional gain as a (1,1) or (K,1) array.
+        Ki: Integral gain as a (1,1) or (K,1) array.
+        Kd: Derivative gain as a (1,1) or (K,1) array.
+        u_min: Lower saturation bound as a (1,1) or (K,1) array, or None.
+        u_max: Upper saturation bound as a (1,1) or (K,1) array, or None.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        controller: str = "PID",
+        Kp: ArrayLike = 0.0,
+        Ki: ArrayLike = 0.0,
+        Kd: ArrayLike = 0.0,
+        u_min: ArrayLike | None = None,
+        u_max: ArrayLike | None = None,
+        integration_method: str = "euler forward",
+        sample_time: float | None = None,
+    ):
+        """Initialize a bank of PID controllers.
+
+        Args:
+            name: Unique identifier for this block instance.
+            controller: Control mode shared by all channels. Must be one of
+                ``{"P", "I", "PI", "PD", "PID"}``.
+            Kp: Proportional gain. Scalar or (K,1) vector.
+            Ki: Integral gain. Scalar or (K,1) vector.
+            Kd: Derivative gain. Scalar or (K,1) vector.
+            u_min: Minimum output saturation bound. None to disable.
+            u_max: Maximum output saturation bound. None to disable.
+            integration_method: Integration scheme for the I term.
+                Must be ``"euler forward"`` or ``"euler backward"``.
+            sample_time: Sampling period in seconds, or None to use the
+                global simulation dt.
+
+        Raises:
+            ValueError: If ``controller`` or ``integration_method`` is
+                invalid, if a parameter is not a scalar or a column vector,
+                if vector parameters have different lengths, or if
+                ``u_min > u_max`` on any channel.
+        """
+        super().__init__(name, sample_time)
+
+        controller = controller.upper()
+        allowed_types = {"P", "I", "PI", "PD", "PID"}
+        if controller not in allowed_types:
+            raise ValueError(
+                f"[{self.name}] Invalid controller type '{controller}'. Allowed: {allowed_types}"
+            )
+        self.controller = controller
+
+        self.integration_method = integration_method.lower()
+        allowed = ("euler forward", "euler backward")
+        if self.integration_method not in allowed:
+            raise ValueError(
+                f"[{self.name}] Unsupported method '{self.integration_method}'. Allowed: {allowed}"
+            )
+
+        self._channels: int | None = None
+
+        self.Kp = self._to_channels("Kp", Kp)
+        self.Ki = self._to_channels("Ki", Ki)
+        self.Kd = self._to_channels("Kd", Kd)
+
+        self.u_min = None if u_min is None else self._to_channels("u_min", u_min)
+        self.u_max = None if u_max is None else self._to_channels("u_max", u_max)
+
+        if self.u_min is not None and self.u_max is not None:
+            if np.any(self.u_min > self.u_max):
+                raise ValueError(f"[{self.name}] u_min must be <= u_max on every channel.")
+
+        self._has_p = "P" in self.controller
+        self._has_i = "I" in self.controller
+        self._has_d = "D" in self.controller
+        self._backward = (self.integration_method == "euler backward")
+
+        self._resolve_bounds()
+
+        if self._has_p or self._has_d:
+            self.direct_feedthrough = True
+        else:
+            # I-only
+            self.direct_feedthrough = self._backward
+
+        self.inputs["e"] = None
+        self.outputs["u"] = None
+
+        self.state["x_i"] = None
+        self.state["e_prev"] = None
+        self.next_state["x_i"] = None
+        self.next_state["e_prev"] = None
+
+        self._tmp: np.ndarray | None = None
+
+        # 1/dt for the D term, recomputed only when the step size changes
+        self._dt: float | None = None
+        self._inv_dt = 0.0
+
+
+    # --------------------------------------------------------------------------
+    # Public methods
+    # --------------------------------------------------------------------------
+
+    def initialize(self, t0: float) -> None:
+        """Set the output and internal states to zero.
+
+        The states are allocated once the number of channels is known,
+        either from the parameters or from the input if it is already set.
+
+        Args:
+            t0: Initial simulation time in seconds.
+        """
+        self._resolve_bounds()
+
+        e_in = self.inputs["e"]
+        if self._channels is None and e_in is not None:
+            self._read_error(e_in)
+
+        if self._channels is None:
+            self.outputs["u"] = np.zeros((1, 1), dtype=float)
+            return
+
+        self._allocate_states()
+        self.outputs["u"] = np.zeros((self._channels, 1), dtype=float)
+
+    def output_update(self, t: float, dt: float) -> None:
+        """Compute the control command of every channel.
+
+        Args:
+            t: Current simulation time in seconds.
+            dt: Current time step in seconds.
+
+        Raises:
+            RuntimeError: If input ``e`` is not connected.
+            ValueError: If ``e`` is not a (K,1) vector.
+        """
+        e = self._read_error(self.inputs["e"])
+
+        if self._has_p:
+            u = np.multiply(self.Kp, e)
+        else:
+            u = np.zeros_like(e)
+
+        tmp = self._tmp
+        if self._has_i:
+            u += self._x_i
+            if self._backward:
+                np.multiply(self.Ki, e, out=tmp)
+                tmp *= dt
+                u += tmp
+
+        if self._has_d:
+            if dt != self._dt:
+                self._dt = dt
+                self._inv_dt = 1.0 / dt
+            np.subtract(e, self._e_prev, out=tmp)
+            tmp *= self.Kd
+            tmp *= self._inv_dt
+            u += tmp
+
+        if self.u_min is not None or self.u_max is not None:
+            self._saturate(u)
+
+        self.outputs["u"] = u
+
+    def state_update(self, t: float, dt: float) -> None:
+        """Update the integrator states and store the previous errors.
+
+        Args:
+            t: Current simulation time in seconds.
+            dt: Current time step in seconds.
+
+        Raises:
+            RuntimeError: If input ``e`` is not connected.
+            ValueError: If ``e`` is not a (K,1) vector.
+        """
+        e = self._read_error(self.inputs["e"])
+
+        if self._has_i:
+            x_i_next = self._x_i_next
+            np.multiply(self.Ki, e, out=x_i_next)
+            x_i_next *= dt
+            x_i_next += self._x_i
+
+            # Anti-windup: clamp integral states to saturation bounds
+            if self.u_min is not None or self.u_max is not None:
+                self._saturate(x_i_next)
+
+        if self._has_d:
+            np.copyto(self._e_prev_next, e)
+
+    def commit_state(self) -> None:
+        """Copy the next states into the state arrays in place."""
+        if self._channels is None:
+            return
+        if self._has_i:
+            np.copyto(self._x_i, self._x_i_next)
+        if self._has_d:
+            np.copyto(self._e_prev, self._e_prev_next)
+
+
+    # --------------------------------------------------------------------------
+    # Private methods
+    # --------------------------------------------------------------------------
+
+    def _resolve_bounds(self) -> None:
+        """Store the saturation bounds as arrays, a missing bound being +-inf."""
+        self._src_min = self.u_min
+        self._src_max = self.u_max
+        self._u_lo = np.full((1, 1), -np.inf) if self.u_min is None else np.asarray(self.u_min, dtype=float)
+        self._u_hi = np.full((1, 1), np.inf) if self.u_max is None else np.asarray(self.u_max, dtype=float)
+
+    def _saturate(self, arr: np.ndarray) -> None:
+        """Clamp every channel of arr to the saturation bounds in place."""
+        # bounds reassigned during the run (e.g. a GUI slider): resolve again
+        if self.u_min is not self._src_min or self.u_max is not self._src_max:
+            self._resolve_bounds()
+
+        np.clip(arr, self._u_lo, self._u_hi, out=arr)
+
+    def _allocate_states(self) -> None:
+        """Allocate zero states and scratch for the resolved channel count.
+
+        The state arrays are bound to attributes and updated in place by
+        ``commit_state``.
+        """
+        shape = (self._channels, 1)
+        for key in ("x_i", "e_prev"):
+            self.state[key] = np.zeros(shape, dtype=float)
+            self.next_state[key] = np.zeros(shape, dtype=float)
+        self._x_i = self.state["x_i"]
+        self._e_prev = self.state["e_prev"]
+        self._x_i_next = self.next_state["x_i"]
+        self._e_prev_next = self.next_state["e_prev"]
+        self._tmp = np.zeros(shape, dtype=float)
+
+    def _read_error(self, e_in: ArrayLike | None) -> np.ndarray:
+        """Return the error as a (K,1) float array, resolving K on first use."""
+        if e_in is None:
+            raise RuntimeError(f"[{self.name}] Missing input 'e'.")
+
+        if type(e_in) is np.ndarray and e_in.dtype is FLOAT64:
+            e = e_in
+        else:
+            e = np.asarray(e_in, dtype=float)
+
+        if e.ndim != 2 or e.shape[1] != 1:
+            raise ValueError(
+                f"[{self.name}] Input 'e' must be a (K,1) column vector. Got shape {e.shape}."
+            )
+
+        if self._channels is None:
+            self._channels = e.shape[0]
+            self._allocate_states()
+        elif e.shape[0] != self._channels:
+            raise ValueError(
+                f"[{self.name}] Input 'e' shape mismatch: expected ({self._channels}, 1), got {e.shape}."
+            )
+
+        return e
+
+    def _to_channels(self, name: str, value: ArrayLike) -> np.ndarray:
+        """Normalize a parameter to (1,1) or (K,1) and check K is consistent."""
+        arr = self._to_2d_array(name, value)
+
+        if arr.shape == (1, 1):
+            return arr
+        if arr.shape[1] != 1:
+            raise ValueError(
+                f"[{self.name}] '{name}' must be a scalar or a column vector. Got shape {arr.shape}."
+            )
+
+        if self._channels is None:
+            self._channels = arr.shape[0]
+        elif arr.shape[0] != self._channels:
+            raise ValueError(
+                f"[{self.name}] '{name}' has {arr.shape[0]} channels, expected {self._channels}."
+            )
+        return arr
@@ -25,7 +25,7 @@ import warnings
 import numpy as np
 from numpy.typing import ArrayLike
 
-from pySimBlocks.core.block import Block
+from pySimBlocks.core.block import Block, FLOAT64
 
 
 class Pid(Block):
@@ -116,10 +116,22 @@ class Pid(Block):
 
         self._validate_gains()
 
-        has_p = "P" in self.controller
-        has_d = "D" in self.controller
+        self._resolve_bounds()
 
-        if has_p or has_d:
+        self._has_i = "I" in self.controller
+        self._has_d = "D" in self.controller
+        self._backward = (self.integration_method == "euler backward")
+
+        # only the terms of the selected mode are evaluated at each step
+        self._compute_terms = {
+            "P": self._terms_p,
+            "I": self._terms_i,
+            "PI": self._terms_pi,
+            "PD": self._terms_pd,
+            "PID": self._terms_pid,
+        }[self.controller]
+
+        if "P" in self.controller or self._has_d:
             self.direct_feedthrough = True
         else:
             # I-only
@@ -128,10 +140,18 @@ class Pid(Block):
         self.inputs["e"] = None
         self.outputs["u"] = None
 
-        self.state["x_i"] = np.zeros((1, 1), dtype=float)
-        self.state["e_prev"] = np.zeros((1, 1), dtype=float)
-        self.next_state["x_i"] = np.zeros((1, 1), dtype=float)
-        self.next_state["e_prev"] = np.zeros((1, 1), dtype=float)
+        self._reset_states()
+
+        # scratch term for the I and D contributions
+        self._tmp = np.zeros((1, 1), dtype=float)
+
+        # 1/dt for the D term, recomputed only when the step size changes
+        self._dt: float | None = None
+        self._inv_dt = 0.0
+
+        # error normalized by output_update, reused by state_update
+        self._e_in = None
+        self._e = None
 
 
     # --------------------------------------------------------------------------
@@ -139,12 +159,16 @@ class Pid(Block):
     # --------------------------------------------------------------------------
 
     def initialize(self, t0: float) -> None:
-        """Set the output to zero and keep internal states at zero.
+        """Set the output and internal states to zero.
 
         Args:
             t0: Initial simulation time in seconds.
         """
         self.outputs["u"] = np.zeros((1, 1), dtype=float)
+        self._resolve_bounds()
+        self._reset_states()
+        self._e_in = None
+        self._e = None
 
     def output_update(self, t: float, dt: float) -> None:
         """Compute the PID control command from the current error input.
@@ -161,38 +185,23 @@ class Pid(Block):
             raise RuntimeError(f"[{self.name}] Missing input 'e'.")
 
         e = self._to_siso("e", e_in)
+        self._e_in = e_in
+        self._e = e
 
-        x_i = self.state["x_i"]
-        e_prev = self.state["e_prev"]
-
-        has_p = "P" in self.controller
-        has_i = "I" in self.controller
-        has_d = "D" in self.controller
-
-        P = self.Kp * e if has_p else np.zeros((1, 1), dtype=float)
-
-        if has_i:
-            if self.integration_method == "euler forward":
-                I = x_i
-            else:
-                I = x_i + self.Ki * e * dt
-        else:
-            I = np.zeros((1, 1), dtype=float)
-
-        D = (self.Kd * (e - e_prev) / dt) if has_d else np.zeros((1, 1), dtype=float)
+        # u is the only array allocated per step; it is handed to the output
+        u = self._compute_terms(e, dt)
 
-        u = P + I + D
-
-        if self.u_min is not None:
-            u = np.maximum(u, self.u_min)
-        if self.u_max is not None:
-            u = np.minimum(u, self.u_max)
+        if self.u_min is not None or self.u_max is not None:
+            self._saturate(u)
 
         self.outputs["u"] = u
 
     def state_update(self, t: float, dt: float) -> None:
         """Update the integrator state and store the previous error.
 
+        The integrator state is only updated when the mode has an I term and
+        the previous error only when it has a D term; otherwise they stay zero.
+
         Args:
             t: Current simulation time in seconds.
             dt: Current time step in seconds.
@@ -203,32 +212,131 @@ class Pid(Block):
         e_in = self.inputs["e"]
         if e_in is None:
             raise RuntimeError(f"[{self.name}] Missing input 'e'.")
+        if e_in is self._e_in:
+            # same input object as in output_update: already normalized
+            e = self._e
+        else:
+            e = self._to_siso("e", e_in)
+        self._e_in = None
+        self._e = None
 
-        e = self._to_siso("e", e_in)
+        if self._has_i:
+            x_i_next = self._x_i_next
+            np.multiply(self.Ki, e, out=x_i_next)
+            x_i_next *= dt
+            x_i_next += self._x_i
 
-        has_i = "I" in self.controller
+            # Anti-windup: clamp integral state to saturation bounds
+            if self.u_min is not None or self.u_max is not None:
+                self._saturate(x_i_next)
 
-        if has_i:
-            x_i_next = self.state["x_i"] + self.Ki * e * dt
-        else:
-            x_i_next = self.state["x_i"].copy()
+        if self._has_d:
+            np.copyto(self._e_prev_next, e)
 
-        # Anti-windup: clamp integral state to saturation bounds
-        if self.u_min is not None:
-            x_i_next = np.maximum(x_i_next, self.u_min)
-        if self.u_max is not None:
-            x_i_next = np.minimum(x_i_next, self.u_max)
+    def commit_state(self) -> None:
+        """Copy the next states into the state arrays in place.
 
-        self.next_state["x_i"] = x_i_next
-        self.next_state["e_prev"] = e.copy()
+        The state arrays keep their identity across steps, so the references
+        bound by ``_reset_states`` stay valid.
+        """
+        if self._has_i:
+            np.copyto(self._x_i, self._x_i_next)
+        if self._has_d:
+            np.copyto(self._e_prev, self._e_prev_next)
 
 
     # --------------------------------------------------------------------------
     # Private methods
     # --------------------------------------------------------------------------
 
+    def _resolve_bounds(self) -> None:
+        """Store the saturation bounds as floats, a missing bound being +-inf."""
+        self._src_min = self.u_min
+        self._src_max = self.u_max
+        self._u_lo = -np.inf if self.u_min is None else np.asarray(self.u_min, dtype=float).item()
+        self._u_hi = np.inf if self.u_max is None else np.asarray(self.u_max, dtype=float).item()
+
+    def _saturate(self, arr: np.ndarray) -> None:
+        """Clamp a (1,1) array to the saturation bounds in place.
+
+        On a single element, float comparisons are much cheaper than a NumPy
+        clip call.
+        """
+        # bounds reassigned during the run (e.g. a GUI slider): resolve again
+        if self.u_min is not self._src_min or self.u_max is not self._src_max:
+            self._resolve_bounds()
+
+        v = arr.item()
+        if v > self._u_hi:
+            arr[0, 0] = self._u_hi
+        elif v < self._u_lo:
+            arr[0, 0] = self._u_lo
+
+    def _reset_states(self) -> None:
+        """Allocate zero states and bind them for direct access on the hot path."""
+        for key in ("x_i", "e_prev"):
+            self.state[key] = np.zeros((1, 1), dtype=float)
+            self.next_state[key] = np.zeros((1, 1), dtype=float)
+        self._x_i = self.state["x_i"]
+        self._e_prev = self.state["e_prev"]
+        self._x_i_next = self.next_state["x_i"]
+        self._e_prev_next = self.next_state["e_prev"]
+
+    def _terms_p(self, e: np.ndarray, dt: float) -> np.ndarray:
+        """Return the P command Kp*e."""
+        return np.multiply(self.Kp, e)
+
+    def _terms_i(self, e: np.ndarray, dt: float) -> np.ndarray:
+        """Return the I command."""
+        u = self._x_i.copy()
+        self._add_backward_step(u, e, dt)
+        return u
+
+    def _terms_pi(self, e: np.ndarray, dt: float) -> np.ndarray:
+        """Return the PI command."""
+        u = np.multiply(self.Kp, e)
+        u += self._x_i
+        self._add_backward_step(u, e, dt)
+        return u
+
+    def _terms_pd(self, e: np.ndarray, dt: float) -> np.ndarray:
+        """Return the PD command."""
+        u = np.multiply(self.Kp, e)
+        self._add_d_term(u, e, dt)
+        return u
+
+    def _terms_pid(self, e: np.ndarray, dt: float) -> np.ndarray:
+        """Return the PID command."""
+        u = np.multiply(self.Kp, e)
+        u += self._x_i
+        self._add_backward_step(u, e, dt)
+        self._add_d_term(u, e, dt)
+        return u
+
+    def _add_backward_step(self, u: np.ndarray, e: np.ndarray, dt: float) -> None:
+        """Add Ki*e*dt to u in place for the backward Euler integrator."""
+        if self._backward:
+            tmp = self._tmp
+            np.multiply(self.Ki, e, out=tmp)
+            tmp *= dt
+            u += tmp
+
+    def _add_d_term(self, u: np.ndarray, e: np.ndarray, dt: float) -> None:
+        """Add Kd*(e - e_prev)/dt to u in place."""
+        if dt != self._dt:
+            self._dt = dt
+            self._inv_dt = 1.0 / dt
+        tmp = self._tmp
+        np.subtract(e, self._e_prev, out=tmp)
+        tmp *= self.Kd
+        tmp *= self._inv_dt
+        u += tmp
+
     def _to_siso(self, name: str, value: ArrayLike) -> np.ndarray:
         """Normalize a scalar-like value to a (1,1) array; reject anything else."""
+        # signals already follow the (1,1) float port convention: no conversion
+        if type(value) is np.ndarray and value.shape == (1, 1) and value.dtype is FLOAT64:
+            return value
         if np.isscalar(value):
             return np.array([[float(value)]], dtype=float)
 
@@ -123,7 +123,10 @@ class StateFeedback(Block):
         r = self._require_col_vector("r", self._p)
         x = self._require_col_vector("x", self._n)
 
-        self.outputs["u"] = self.G @ r - self.K @ x
+        # np.dot skips the batching logic of matmul on these small 2D products
+        u = np.dot(self.G, r)
+        u -= np.dot(self.K, x)
+        self.outputs["u"] = u
 
     def state_update(self, t: float, dt: float) -> None:
         """No-op: StateFeedback carries no internal state."""
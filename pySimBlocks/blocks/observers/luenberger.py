@@ -147,7 +147,7 @@ class Luenberger(Block):
         """
         x_hat = self.state["x_hat"]
         self.outputs["x_hat"] = x_hat.copy()
-        self.outputs["y_hat"] = self.C @ x_hat
+        self.outputs["y_hat"] = np.dot(self.C, x_hat)
 
     def state_update(self, t: float, dt: float) -> None:
         """Update the state estimate using the observer correction law.
@@ -164,9 +164,15 @@ class Luenberger(Block):
         y = self._require_col_vector("y", self._p)
 
         x_hat = self.state["x_hat"]
-        y_hat = self.C @ x_hat
 
-        self.next_state["x_hat"] = self.A @ x_hat + self.B @ u + self.L @ (y - y_hat)
+        # innovation y - C x_hat, computed in the product's result array
+        innov = np.dot(self.C, x_hat)
+        np.subtract(y, innov, out=innov)
+
+        x_next = np.dot(self.A, x_hat)
+        x_next += np.dot(self.B, u)
+        x_next += np.dot(self.L, innov)
+        self.next_state["x_hat"] = x_next
 
 
     # --------------------------------------------------------------------------
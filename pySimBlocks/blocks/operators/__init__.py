@@ -21,6 +21,7 @@
 from pySimBlocks.blocks.operators.dead_zone import DeadZone
 from pySimBlocks.blocks.operators.demux import Demux
 from pySimBlocks.blocks.operators.delay import Delay
+from pySimBlocks.blocks.operators.delayed_derivator import DelayedDerivator
 from pySimBlocks.blocks.operators.discrete_derivator import DiscreteDerivator
 from pySimBlocks.blocks.operators.discrete_integrator import DiscreteIntegrator
 from pySimBlocks.blocks.operators.gain import Gain
@@ -35,6 +36,7 @@ __all__ = [
     "DeadZone",
     "Demux",
     "Delay",
+    "DelayedDerivator",
     "DiscreteDerivator",
     "DiscreteIntegrator",
     "Gain",
@@ -23,7 +23,7 @@ from __future__ import annotations
 import importlib.util
 import inspect
 from pathlib import Path
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Sequence
 
 import numpy as np
 
@@ -87,6 +87,13 @@ class AlgebraicFunction(Block):
         if len(self.output_keys) == 0:
             raise ValueError(f"[{self.name}] output_keys cannot be empty.")
 
+        self._input_key_set = frozenset(self.input_keys)
+        self._output_key_set = frozenset(self.output_keys)
+        self._signature_checked = False
+
+        # input keys in the order of the function parameters
+        self._arg_keys = tuple(self.input_keys)
+
         self.inputs: Dict[str, np.ndarray | None] = {k: None for k in self.input_keys}
         self.outputs: Dict[str, np.ndarray | None] = {k: None for k in self.output_keys}
 
@@ -180,11 +187,11 @@ class AlgebraicFunction(Block):
         """
         self._validate_signature()
 
-        out = self._call_func(t0, 0, **self.inputs)
+        out = self._call_func(t0, 0, tuple(self.inputs[k] for k in self._arg_keys))
         if not isinstance(out, dict):
             raise RuntimeError(f"[{self.name}] function must return a dict.")
 
-        if set(out.keys()) != set(self.output_keys):
+        if out.keys() != self._output_key_set:
             raise RuntimeError(
                 f"[{self.name}] output keys mismatch "
                 f"(expected {self.output_keys}, got {list(out.keys())})."
@@ -204,21 +211,27 @@ class AlgebraicFunction(Block):
             TypeError: If any input or output is not a numpy array.
             ValueError: If any input or output is not 2D, or if shapes changed.
         """
-        kwargs: Dict[str, np.ndarray] = {}
-        for k in self.input_keys:
-            u = self.inputs[k]
+        # arrays already at their frozen shape skip the full shape check
+        in_shapes = self._in_shapes
+        inputs = self.inputs
+        args = []
+        for k in self._arg_keys:
+            u = inputs[k]
             if u is None:
                 raise RuntimeError(f"[{self.name}] input '{k}' is not set.")
-            u = np.asarray(u)
-            self._check_freeze_shape("input", k, u, self._in_shapes)
-            kwargs[k] = u
+            if type(u) is not np.ndarray or u.shape != in_shapes[k]:
+                u = np.asarray(u)
+                self._check_freeze_shape("input", k, u, in_shapes)
+            args.append(u)
 
-        out = self._call_func(t, dt, **kwargs)
+        out = self._call_func(t, dt, args)
 
+        out_shapes = self._out_shapes
         for k in self.output_keys:
             y = out[k]
-            y = np.asarray(y)
-            self._check_freeze_shape("output", k, y, self._out_shapes)
+            if type(y) is not np.ndarray or y.shape != out_shapes[k]:
+                y = np.asarray(y)
+                self._check_freeze_shape("output", k, y, out_shapes)
             self.outputs[k] = y
 
     def state_update(self, t: float, dt: float) -> None:
@@ -235,10 +248,13 @@ class AlgebraicFunction(Block):
     # Private methods
     # --------------------------------------------------------------------------
 
-    def _call_func(self, t: float, dt: float, **kwargs) -> Dict[str, np.ndarray]:
-        """Invoke the user function and validate its output dict."""
+    def _call_func(self, t: float, dt: float, args: Sequence[Any]) -> Dict[str, np.ndarray]:
+        """Invoke the user function positionally and validate its output dict.
+
+        ``args`` holds the inputs in the order of the function parameters.
+        """
         try:
-            out = self._func(t, dt, **kwargs)
+            out = self._func(t, dt, *args)
         except Exception as e:
             raise RuntimeError(f"[{self.name}] function call error: {e}\n"
                                f"Must always return a dict with output keys: {self.output_keys}")
@@ -246,7 +262,7 @@ class AlgebraicFunction(Block):
         if not isinstance(out, dict):
             raise RuntimeError(f"[{self.name}] function must return a dict.")
 
-        if not set(self.output_keys).issubset(out.keys()):
+        if not self._output_key_set <= out.keys():
             raise RuntimeError(
                 f"[{self.name}] missing output keys "
                 f"(expected {self.output_keys}, got {list(out.keys())})."
@@ -261,7 +277,14 @@ class AlgebraicFunction(Block):
         return out
 
     def _validate_signature(self) -> None:
-        """Raise if the function signature does not match (t, dt, *input_keys)."""
+        """Raise if the function signature does not match (t, dt, *input_keys).
+
+        The function and keys are fixed at construction, so the check only
+        runs once.
+        """
+        if self._signature_checked:
+            return
+
         sig = inspect.signature(self._func)
         params = list(sig.parameters.values())
 
@@ -276,13 +299,17 @@ class AlgebraicFunction(Block):
                 raise ValueError(f"[{self.name}] *args and **kwargs are not allowed.")
 
         declared = [p.name for p in params[2:]]
-        if set(declared) != set(self.input_keys):
+        if set(declared) != self._input_key_set:
             raise ValueError(
                 f"[{self.name}] function arguments mismatch.\n"
                 f"Expected inputs: {self.input_keys}\n"
                 f"Function declares: {declared}"
             )
 
+        self._arg_keys = tuple(declared)
+
+        self._signature_checked = True
+
     def _check_freeze_shape(self, which: str, key: str, arr: np.ndarray, store: Dict[str, tuple[int, int] | None]) -> None:
         """Validate that an array is 2D and freeze its shape on the first call."""
         if not isinstance(arr, np.ndarray):
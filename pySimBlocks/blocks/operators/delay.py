@@ -23,7 +23,7 @@ from __future__ import annotations
 import numpy as np
 from numpy.typing import ArrayLike
 
-from pySimBlocks.core.block import Block
+from pySimBlocks.core.block import Block, FLOAT64
 
 
 class Delay(Block):
@@ -39,6 +39,13 @@ class Delay(Block):
     initial value is broadcast to match the first input. Once the shape is
     fixed, any mismatch raises an error.
 
+    The delayed samples are stored in a single ``(num_delays + 1, m, n)`` ring
+    buffer. ``state["head"]`` indexes the oldest sample, which is the current
+    output. The output is a read-only view of that slot; the spare slot lets
+    the next input be committed without overwriting it. The view is only
+    valid until the next step: later commits reuse the slot, so callers that
+    keep an output across steps must copy it.
+
     Attributes:
         num_delays: Number of discrete steps N (>= 1).
     """
@@ -78,8 +85,10 @@ class Delay(Block):
         self.outputs["out"] = None
 
         self.state["buffer"] = None
-        self.next_state["buffer"] = None
+        self.state["head"] = 0
+        self.next_state["head"] = 0
 
+        self._pending: np.ndarray | None = None
         self._shape_fixed: bool = False
         self._buffer_shape: tuple[int, int] | None = None
 
@@ -94,8 +103,7 @@ class Delay(Block):
                 self._shape_fixed = True
                 self._buffer_shape = init.shape
 
-        self.state["buffer"] = [init.copy() for _ in range(self.num_delays)]
-        self.next_state["buffer"] = None
+        self.state["buffer"] = self._make_buffer(init)
 
 
     # --------------------------------------------------------------------------
@@ -109,25 +117,14 @@ class Delay(Block):
             t0: Initial simulation time in seconds.
 
         Raises:
-            ValueError: If the initial output shape is inconsistent with the
-                resolved buffer shape.
+            ValueError: If the input shape is inconsistent with the initial
+                output.
         """
-        out = self.state["buffer"][0]
-
         u = self.inputs["in"]
         if u is not None:
-            u_arr = np.asarray(u, dtype=float)
-            self._ensure_shape_and_buffer(u_arr)
+            self._ensure_shape_and_buffer(np.asarray(u, dtype=float))
 
-            if self._is_scalar_2d(out) and self._buffer_shape != (1, 1):
-                out = np.full(self._buffer_shape, float(out[0, 0]), dtype=float)
-            else:
-                if out.shape != self._buffer_shape:
-                    raise ValueError(
-                        f"[{self.name}] Initial output shape mismatch: expected {self._buffer_shape}, got {out.shape}."
-                    )
-
-        self.outputs["out"] = out
+        self.outputs["out"] = self.state["buffer"][self.state["head"]].copy()
 
     def output_update(self, t: float, dt: float) -> None:
         """Output the oldest buffer entry.
@@ -142,10 +139,12 @@ class Delay(Block):
                 u_arr = np.asarray(u, dtype=float)
                 self._ensure_shape_and_buffer(u_arr)
 
-        self.outputs["out"] = self.state["buffer"][0].copy()
+        out = self.state["buffer"][self.state["head"]]
+        out.flags.writeable = False
+        self.outputs["out"] = out
 
     def state_update(self, t: float, dt: float) -> None:
-        """Shift the buffer left and append the current input.
+        """Queue the current input for the free slot of the ring buffer.
 
         Args:
             t: Current simulation time in seconds.
@@ -164,24 +163,40 @@ class Delay(Block):
         if u is None:
             raise RuntimeError(f"[{self.name}] Input 'in' is not connected or not set.")
 
-        u_arr = np.asarray(u, dtype=float)
+        if type(u) is np.ndarray and u.dtype is FLOAT64:
+            u_arr = u
+        else:
+            u_arr = np.asarray(u, dtype=float)
 
-        self._ensure_shape_and_buffer(u_arr)
+        # the full check only runs until the shape is fixed or on a mismatch
+        if u_arr.shape != self._buffer_shape:
+            self._ensure_shape_and_buffer(u_arr)
 
-        buffer = self.state["buffer"]
+        self._pending = u_arr
+        self.next_state["head"] = (self.state["head"] + 1) % (self.num_delays + 1)
 
-        new_buffer = []
-        for i in range(self.num_delays - 1):
-            new_buffer.append(buffer[i + 1].copy())
-        new_buffer.append(u_arr.copy())
+    def commit_state(self) -> None:
+        """Write the queued input into the free slot and advance the head.
 
-        self.next_state["buffer"] = new_buffer
+        The ring buffer is updated in place, so committing is O(1) in
+        ``num_delays`` instead of copying the whole buffer. The free slot is
+        the one behind the head, never the slot of the current output.
+        """
+        if self._pending is not None:
+            head = self.state["head"]
+            self.state["buffer"][(head + self.num_delays) % (self.num_delays + 1)] = self._pending
+            self._pending = None
+        self.state["head"] = self.next_state["head"]
 
 
     # --------------------------------------------------------------------------
     # Private methods
     # --------------------------------------------------------------------------
 
+    def _make_buffer(self, init: np.ndarray) -> np.ndarray:
+        """Return a contiguous ring buffer with every slot set to ``init``."""
+        return np.repeat(init[np.newaxis], self.num_delays + 1, axis=0)
+
     def _ensure_shape_and_buffer(self, u: np.ndarray) -> None:
         """Validate input shape and fix the buffer shape on the first non-None input."""
         if u.ndim != 2:
@@ -189,11 +204,12 @@ class Delay(Block):
                 f"[{self.name}] Input 'in' must be a 2D array. Got ndim={u.ndim} with shape {u.shape}."
             )
 
-        buf0 = self.state["buffer"][0]
-        assert buf0 is not None
+        buffer = self.state["buffer"]
+        assert buffer is not None
+        buf_shape = buffer.shape[1:]
 
         if self._shape_fixed:
-            expected = buf0.shape
+            expected = buf_shape
             if u.shape != expected:
                 raise ValueError(
                     f"[{self.name}] Input 'in' shape mismatch: expected {expected}, got {u.shape}."
@@ -202,17 +218,17 @@ class Delay(Block):
 
         target_shape = u.shape
 
-        if self._is_scalar_2d(buf0) and target_shape != (1, 1):
-            scalar = float(buf0[0, 0])
-            self.state["buffer"] = [
-                np.full(target_shape, scalar, dtype=float) for _ in range(self.num_delays)
-            ]
-            buf0 = self.state["buffer"][0]
+        if buf_shape == (1, 1) and target_shape != (1, 1):
+            scalar = float(buffer[0, 0, 0])
+            self.state["buffer"] = np.full(
+                (self.num_delays + 1, *target_shape), scalar, dtype=float
+            )
+            buf_shape = target_shape
 
-        if buf0.shape != target_shape:
+        if buf_shape != target_shape:
             raise ValueError(
                 f"[{self.name}] Cannot infer a consistent delay shape: "
-                f"buffer currently {buf0.shape} but first input is {target_shape}."
+                f"buffer currently {buf_shape} but first input is {target_shape}."
             )
 
         self._shape_fixed = True
@@ -251,5 +267,7 @@ class Delay(Block):
         else:
             init = np.zeros((1, 1), dtype=float)
 
-        self.state["buffer"] = [init.copy() for _ in range(self.num_delays)]
-        self.next_state["buffer"] = [init.copy() for _ in range(self.num_delays)]
+        self.state["buffer"] = self._make_buffer(init)
+        self.state["head"] = 0
+        self.next_state["head"] = 0
+        self._pending = None
@@ -0,0 +1,202 @@
+# ******************************************************************************
+#                                  pySimBlocks
+#                     Copyright (c) 2026 Université de Lille & INRIA
+# ******************************************************************************
+#  This program is free software: you can redistribute it and/or modify it
+#  under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or (at your
+#  option) any later version.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+#  FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+#  for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ******************************************************************************
+#  Authors: see Authors.txt
+# ******************************************************************************
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from pySimBlocks.core.block import Block, FLOAT64
+
+
+class DelayedDerivator(Block):
+    """Backward finite difference of an N-step delayed signal.
+
+    Equivalent to a Delay followed by a DiscreteDerivator, with a single
+    sample history instead of two:
+
+        y[k] = (u[k - N] - u[k - N - 1]) / dt
+
+    Samples before the start of the simulation are equal to
+    ``initial_output``, so the first output is zero. Both samples are already
+    stored when the output is computed, hence the block has no direct
+    feedthrough.
+
+    The signal shape follows the Delay policy: a non-scalar
+    ``initial_output`` fixes it immediately, otherwise it is taken from the
+    first input and a scalar initial value is broadcast once.
+
+    Attributes:
+        num_delays: Number of discrete steps N (>= 1).
+    """
+
+    direct_feedthrough = False
+
+    def __init__(
+        self,
+        name: str,
+        num_delays: int = 1,
+        initial_output: ArrayLike | None = None,
+        sample_time: float | None = None,
+    ):
+        """Initialize a DelayedDerivator block.
+
+        Args:
+            name: Unique identifier for this block instance.
+            num_delays: Number of discrete steps to delay the input before
+                differentiating. Must be >= 1.
+            initial_output: Value of the delayed signal before the start of
+                the simulation. Accepted shapes: scalar, 1D, or 2D. A
+                non-scalar 2D value fixes the signal shape immediately.
+            sample_time: Sampling period in seconds, or None to use the global
+                simulation dt.
+
+        Raises:
+            ValueError: If ``num_delays`` is not a positive integer.
+        """
+        super().__init__(name, sample_time)
+
+        if not isinstance(num_delays, int) or num_delays < 1:
+            raise ValueError(f"[{self.name}] num_delays must be >= 1.")
+        self.num_delays = num_delays
+
+        self.inputs["in"] = None
+        self.outputs["out"] = None
+
+        self._shape_fixed = False
+
+        init = np.zeros((1, 1), dtype=float)
+        if initial_output is not None:
+            init = self._to_2d_array("initial_output", initial_output)
+            self._shape_fixed = not self._is_scalar_2d(init)
+
+        # u[k-N-1] ... u[k-1]; head indexes the oldest sample
+        self.state["buffer"] = np.repeat(init[np.newaxis], num_delays + 1, axis=0)
+        self.state["head"] = 0
+        self.next_state["head"] = 0
+
+        self._pending: np.ndarray | None = None
+
+        # 1/dt, recomputed only when the step size changes
+        self._dt: float | None = None
+        self._inv_dt = 0.0
+
+
+    # --------------------------------------------------------------------------
+    # Public methods
+    # --------------------------------------------------------------------------
+
+    def initialize(self, t0: float) -> None:
+        """Set a zero initial output, resolving the shape if the input is set.
+
+        Args:
+            t0: Initial simulation time in seconds.
+
+        Raises:
+            ValueError: If the input shape is inconsistent with the initial
+                output.
+        """
+        u = self.inputs["in"]
+        if u is not None:
+            self._ensure_shape(np.asarray(u, dtype=float))
+
+        self.outputs["out"] = np.zeros(self.state["buffer"].shape[1:], dtype=float)
+
+    def output_update(self, t: float, dt: float) -> None:
+        """Output the scaled difference of the two oldest samples.
+
+        Args:
+            t: Current simulation time in seconds.
+            dt: Current time step in seconds.
+        """
+        if not self._shape_fixed:
+            u = self.inputs["in"]
+            if u is not None:
+                self._ensure_shape(np.asarray(u, dtype=float))
+
+        if dt != self._dt:
+            self._dt = dt
+            self._inv_dt = 1.0 / dt
+
+        buffer = self.state["buffer"]
+        head = self.state["head"]
+        y = np.subtract(buffer[(head + 1) % (self.num_delays + 1)], buffer[head])
+        y *= self._inv_dt
+        self.outputs["out"] = y
+
+    def state_update(self, t: float, dt: float) -> None:
+        """Queue the current input for the slot of the oldest sample.
+
+        Args:
+            t: Current simulation time in seconds.
+            dt: Current time step in seconds.
+
+        Raises:
+            RuntimeError: If input ``'in'`` is not connected.
+            ValueError: If the input is not 2D or its shape is inconsistent
+                with the buffer.
+        """
+        u = self.inputs["in"]
+        if u is None:
+            raise RuntimeError(f"[{self.name}] Input 'in' is not connected or not set.")
+
+        if type(u) is np.ndarray and u.dtype is FLOAT64:
+            u_arr = u
+        else:
+            u_arr = np.asarray(u, dtype=float)
+        self._ensure_shape(u_arr)
+
+        self._pending = u_arr
+        self.next_state["head"] = (self.state["head"] + 1) % (self.num_delays + 1)
+
+    def commit_state(self) -> None:
+        """Write the queued input over the oldest sample and advance the head."""
+        if self._pending is not None:
+            self.state["buffer"][self.state["head"]] = self._pending
+            self._pending = None
+        self.state["head"] = self.next_state["head"]
+
+
+    # --------------------------------------------------------------------------
+    # Private methods
+    # --------------------------------------------------------------------------
+
+    def _ensure_shape(self, u: np.ndarray) -> None:
+        """Validate the input shape, broadcasting a scalar buffer on first use."""
+        if u.ndim != 2:
+            raise ValueError(
+                f"[{self.name}] Input 'in' must be a 2D array. Got ndim={u.ndim} with shape {u.shape}."
+            )
+
+        buffer = self.state["buffer"]
+        expected = buffer.shape[1:]
+
+        if not self._shape_fixed:
+            if expected == (1, 1) and u.shape != (1, 1):
+                self.state["buffer"] = np.full(
+                    (self.num_delays + 1, *u.shape), float(buffer[0, 0, 0]), dtype=float
+                )
+                expected = u.shape
+            self._shape_fixed = True
+
+        if u.shape != expected:
+            raise ValueError(
+                f"[{self.name}] Input 'in' shape mismatch: expected {expected}, got {u.shape}."
+            )
@@ -59,8 +59,9 @@ class Demux(Block):
         self.num_outputs = num_outputs
 
         self.inputs["in"] = None
-        for i in range(num_outputs):
-            self.outputs[f"out{i+1}"] = None
+        self._output_keys = tuple(f"out{i+1}" for i in range(num_outputs))
+        for key in self._output_keys:
+            self.outputs[key] = None
 
 
     # --------------------------------------------------------------------------
@@ -74,8 +75,8 @@ class Demux(Block):
             t0: Initial simulation time in seconds.
         """
         if self.inputs["in"] is None:
-            for i in range(self.num_outputs):
-                self.outputs[f"out{i+1}"] = np.zeros((1, 1), dtype=float)
+            for key in self._output_keys:
+                self.outputs[key] = np.zeros((1, 1), dtype=float)
             return
 
         self._compute_outputs()
@@ -138,8 +139,8 @@ class Demux(Block):
         m = n % p
 
         start = 0
-        for i in range(p):
+        for i, key in enumerate(self._output_keys):
             seg_len = q + 1 if i < m else q
             end = start + seg_len
-            self.outputs[f"out{i+1}"] = vec[start:end].copy()
+            self.outputs[key] = vec[start:end].copy()
             start = end
@@ -23,7 +23,7 @@ from __future__ import annotations
 import numpy as np
 from numpy.typing import ArrayLike
 
-from pySimBlocks.core.block import Block
+from pySimBlocks.core.block import Block, FLOAT64
 
 
 class DiscreteDerivator(Block):
@@ -73,6 +73,10 @@ class DiscreteDerivator(Block):
 
         self._placeholder = np.zeros((1, 1), dtype=float)
 
+        # 1/dt, recomputed only when the step size changes
+        self._dt: float | None = None
+        self._inv_dt = 0.0
+
         self._initial_output_raw: np.ndarray | None = None
         if initial_output is not None:
             y0 = self._to_2d_array("initial_output", initial_output).astype(float)
@@ -144,17 +148,30 @@ class DiscreteDerivator(Block):
                 f"[{self.name}] Previous input shape mismatch: u_prev={u_prev_arr.shape}, u={u_arr.shape}."
             )
 
-        self.outputs["out"] = (u_arr - u_prev_arr) / dt
+        if dt != self._dt:
+            self._dt = dt
+            self._inv_dt = 1.0 / dt
+
+        y = np.subtract(u_arr, u_prev_arr)
+        y *= self._inv_dt
+        self.outputs["out"] = y
 
     def state_update(self, t: float, dt: float) -> None:
         """Store the current input as the previous value for the next step.
 
+        The value is copied into the existing next-state buffer when shapes
+        match, since commit_state copies it into the state anyway.
+
         Args:
             t: Current simulation time in seconds.
             dt: Current time step in seconds.
         """
         u_arr = self._normalize_input(self.inputs["in"])
-        self.next_state["u_prev"] = u_arr.copy()
+        u_next = self.next_state["u_prev"]
+        if u_next is not None and u_next.shape == u_arr.shape:
+            np.copyto(u_next, u_arr)
+        else:
+            self.next_state["u_prev"] = u_arr.copy()
 
 
     # --------------------------------------------------------------------------
@@ -189,6 +206,14 @@ class DiscreteDerivator(Block):
                 return np.zeros(self._resolved_shape, dtype=float)
             return self._placeholder.copy()
 
+        # steady state: a float input already at the frozen shape is used as is
+        if (
+            type(u) is np.ndarray
+            and u.dtype is FLOAT64
+            and u.shape == self._resolved_shape
+        ):
+            return u
+
         u_arr = np.asarray(u, dtype=float)
         if u_arr.ndim != 2:
             raise ValueError(
@@ -23,14 +23,14 @@ from __future__ import annotations
 import numpy as np
 from numpy.typing import ArrayLike
 
-from pySimBlocks.core.block import Block
+from pySimBlocks.core.block import Block, FLOAT64
 
 
 class DiscreteIntegrator(Block):
     """Discrete-time integrator block.
 
-    Integrates an input signal over time using either Euler forward or Euler
-    backward integration. The state update is:
+    Integrates an input signal over time using Euler forward, Euler backward
+    or trapezoidal integration. The state update is:
 
         x[k+1] = x[k] + dt * u[k]
 
@@ -40,12 +40,16 @@ class DiscreteIntegrator(Block):
 
         y[k] = x[k] + dt * u[k]       (Euler backward)
 
-    Euler forward has no direct feedthrough; Euler backward does. The output
+        y[k] = x[k] + dt/2 * u[k]     (trapezoidal)
+
+    Euler forward has no direct feedthrough; Euler backward and trapezoidal
+    do. The output
     shape is resolved from the first non-scalar input and then frozen. A scalar
     (1,1) input is broadcast to the frozen shape. The output is never ``None``.
 
     Attributes:
-        method: Integration method, ``'euler forward'`` or ``'euler backward'``.
+        method: Integration method, ``'euler forward'``, ``'euler backward'``
+            or ``'trapezoidal'``.
     """
 
     def __init__(
@@ -61,25 +65,26 @@ class DiscreteIntegrator(Block):
             name: Unique identifier for this block instance.
             initial_state: Initial value of the integrated state. If provided
                 and non-scalar, it fixes the signal shape immediately.
-            method: Integration method. Either ``'euler forward'`` or
-                ``'euler backward'``.
+            method: Integration method. One of ``'euler forward'``,
+                ``'euler backward'`` or ``'trapezoidal'``.
             sample_time: Sampling period in seconds, or None to use the global
                 simulation dt.
 
         Raises:
-            ValueError: If ``method`` is not ``'euler forward'`` or
-                ``'euler backward'``.
+            ValueError: If ``method`` is not ``'euler forward'``,
+                ``'euler backward'`` or ``'trapezoidal'``.
         """
         super().__init__(name, sample_time)
 
         self.method = method.lower()
-        if self.method not in ("euler forward", "euler backward"):
+        if self.method not in ("euler forward", "euler backward", "trapezoidal"):
             raise ValueError(
                 f"[{self.name}] Unsupported method '{method}'. "
-                f"Allowed: 'euler forward', 'euler backward'."
+                f"Allowed: 'euler forward', 'euler backward', 'trapezoidal'."
             )
 
-        self.direct_feedthrough = (self.method == "euler backward")
+        self.direct_feedthrough = (self.method != "euler forward")
+        self._dt_weight = self._output_dt_weight()
 
         self.inputs["in"] = None
         self.outputs["out"] = None
@@ -118,15 +123,21 @@ class DiscreteIntegrator(Block):
         Args:
             t0: Initial simulation time in seconds.
         """
-        if self._initial_state_raw is not None:
-            x0 = self._initial_state_raw.copy()
-            self.state["x"] = x0.copy()
+        self._dt_weight = self._output_dt_weight()
+
+        x0 = self._initial_state_raw
+        if x0 is None:
+            x0 = self._placeholder
+
+        # the output shares the state array, as in the forward output_update
+        self.state["x"] = x0.copy()
+        self.outputs["out"] = self.state["x"]
+
+        x_next = self.next_state["x"]
+        if x_next is None or x_next.shape != x0.shape:
             self.next_state["x"] = x0.copy()
-            self.outputs["out"] = x0.copy()
         else:
-            self.state["x"] = self._placeholder.copy()
-            self.next_state["x"] = self._placeholder.copy()
-            self.outputs["out"] = self._placeholder.copy()
+            np.copyto(x_next, x0)
 
     def output_update(self, t: float, dt: float) -> None:
         """Compute the output from the current state according to the integration method.
@@ -137,12 +148,16 @@ class DiscreteIntegrator(Block):
         """
         x = self._normalize_state()
 
-        if self.method == "euler forward":
-            self.outputs["out"] = x.copy()
+        if self._dt_weight is None:
+            # commit_state replaces state["x"] by a new array: x is never
+            # written again and can be handed out without a copy
+            self.outputs["out"] = x
             return
 
         u = self._normalize_input(self.inputs["in"])
-        self.outputs["out"] = x + dt * u
+        y = np.multiply(u, self._dt_weight * dt)
+        y += x
+        self.outputs["out"] = y
 
     def state_update(self, t: float, dt: float) -> None:
         """Advance the integrator state by one step.
@@ -164,13 +179,24 @@ class DiscreteIntegrator(Block):
                     f"[{self.name}] Shape mismatch between state and input: x={x.shape}, u={u.shape}."
                 )
 
-        self.next_state["x"] = x + dt * u
+        # the next-state buffer is reused; commit_state copies it into x
+        x_next = self.next_state["x"]
+        if x_next is None or x_next.shape != x.shape:
+            x_next = self.next_state["x"] = np.empty_like(x)
+        np.multiply(u, dt, out=x_next)
+        x_next += x
 
 
     # --------------------------------------------------------------------------
     # Private methods
     # --------------------------------------------------------------------------
 
+    def _output_dt_weight(self) -> float | None:
+        """Return the weight of ``dt * u`` in the output, None without feedthrough."""
+        if self.method == "euler forward":
+            return None
+        return 0.5 if self.method == "trapezoidal" else 1.0
+
     def _maybe_freeze_shape_from(self, u: np.ndarray) -> None:
         """Freeze the signal shape from the first non-scalar input."""
         if u.ndim != 2:
@@ -203,6 +229,14 @@ class DiscreteIntegrator(Block):
                 return np.zeros(self._resolved_shape, dtype=float)
             return self._placeholder.copy()
 
+        # an unresolved shape means a scalar signal, which needs no broadcast
+        if (
+            type(u) is np.ndarray
+            and u.dtype is FLOAT64
+            and u.shape == (self._resolved_shape or (1, 1))
+        ):
+            return u
+
         u_arr = np.asarray(u, dtype=float)
         if u_arr.ndim != 2:
             raise ValueError(
@@ -224,7 +258,15 @@ class DiscreteIntegrator(Block):
 
     def _normalize_state(self) -> np.ndarray:
         """Ensure the state exists and matches the resolved shape."""
-        x = np.asarray(self.state["x"], dtype=float)
+        x = self.state["x"]
+        if (
+            type(x) is np.ndarray
+            and x.dtype is FLOAT64
+            and x.shape == (self._resolved_shape or (1, 1))
+        ):
+            return x
+
+        x = np.asarray(x, dtype=float)
 
         if self._resolved_shape is not None and self._resolved_shape != (1, 1):
             if x.shape == (1, 1):
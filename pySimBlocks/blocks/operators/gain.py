@@ -26,7 +26,7 @@ import unicodedata
 import numpy as np
 from numpy.typing import ArrayLike
 
-from pySimBlocks.core.block import Block
+from pySimBlocks.core.block import Block, FLOAT64
 
 
 class Gain(Block):
@@ -90,6 +90,8 @@ class Gain(Block):
             self.gain = g
             self._gain_kind = "vector" if g.ndim == 1 else "matrix"
 
+        self._multiply = self._select_multiply()
+
         self.inputs["in"] = None
         self.outputs["out"] = None
 
@@ -142,6 +144,8 @@ class Gain(Block):
         Args:
             t0: Initial simulation time in seconds.
         """
+        self._multiply = self._select_multiply()
+
         u = self.inputs["in"]
         if u is None:
             self.outputs["out"] = None
@@ -209,20 +213,24 @@ class Gain(Block):
 
     def _compute(self, u) -> np.ndarray:
         """Validate input and dispatch to the active multiplication method."""
-        u = np.asarray(u, dtype=float)
+        if type(u) is not np.ndarray or u.dtype is not FLOAT64:
+            u = np.asarray(u, dtype=float)
         if u.ndim != 2:
             raise ValueError(
                 f"[{self.name}] Input 'in' must be a 2D array. Got ndim={u.ndim} with shape {u.shape}."
             )
+        return self._multiply(u)
 
+    def _select_multiply(self):
+        """Return the bound method implementing the active multiplication mode."""
         if self.multiplication == self.MULT_ELEMENTWISE:
-            return self._elementwise(u)
+            return self._elementwise
 
         if self.multiplication == self.MULT_LEFT:
-            return self._left_multiply(u)
+            return self._left_multiply
 
         if self.multiplication == self.MULT_RIGHT:
-            return self._right_multiply(u)
+            return self._right_multiply
 
         raise RuntimeError(f"[{self.name}] Unhandled multiplication mode: {self.multiplication}")
 
@@ -232,13 +240,14 @@ class Gain(Block):
             return self.gain * u
 
         if self._gain_kind == "vector":
-            g = self.gain
+            # reshape is a view, built per call so a reassigned gain is used
+            g = np.reshape(self.gain, (-1, 1))
             if g.shape[0] != 1 and u.shape[0] != g.shape[0]:
                 raise ValueError(
                     f"[{self.name}] Element-wise mode requires u.shape[0] == len(gain). "
-                    f"Got u.shape={u.shape}, gain.shape={g.shape}."
+                    f"Got u.shape={u.shape}, gain.shape={self.gain.shape}."
                 )
-            return g.reshape(-1, 1) * u
+            return g * u
 
         g = self.gain
         if not self._is_scalar_2d(g) and u.shape != g.shape:
@@ -263,7 +272,7 @@ class Gain(Block):
                 f"[{self.name}] Left matrix product requires u.shape[0] == gain.shape[1]. "
                 f"Got u.shape={u.shape}, gain.shape={K.shape}."
             )
-        return K @ u
+        return np.dot(K, u)
 
     def _right_multiply(self, u: np.ndarray) -> np.ndarray:
         """Apply right matrix multiplication u @ K."""
@@ -23,7 +23,7 @@ from __future__ import annotations
 import numpy as np
 from numpy.typing import ArrayLike
 
-from pySimBlocks.core.block import Block
+from pySimBlocks.core.block import Block, FLOAT64
 
 
 class Mux(Block):
@@ -58,8 +58,9 @@ class Mux(Block):
             raise ValueError(f"[{self.name}] num_inputs must be a positive integer.")
         self.num_inputs = num_inputs
 
-        for i in range(num_inputs):
-            self.inputs[f"in{i+1}"] = None
+        self._input_keys = tuple(f"in{i+1}" for i in range(num_inputs))
+        for key in self._input_keys:
+            self.inputs[key] = None
 
         self.outputs["out"] = None
 
@@ -74,8 +75,8 @@ class Mux(Block):
         Args:
             t0: Initial simulation time in seconds.
         """
-        for i in range(self.num_inputs):
-            if self.inputs[f"in{i+1}"] is None:
+        for key in self._input_keys:
+            if self.inputs[key] is None:
                 self.outputs["out"] = None
                 return
 
@@ -110,6 +111,14 @@ class Mux(Block):
 
     def _to_column_vector(self, input_name: str, value: ArrayLike) -> np.ndarray:
         """Convert a scalar, 1D array, or column vector to a (n,1) array."""
+        if (
+            type(value) is np.ndarray
+            and value.dtype is FLOAT64
+            and value.ndim == 2
+            and value.shape[1] == 1
+        ):
+            return value
+
         arr = np.asarray(value, dtype=float)
 
         if arr.ndim == 0:
@@ -133,12 +142,12 @@ class Mux(Block):
         """Collect and concatenate all input column vectors."""
         vectors = []
 
-        for i in range(self.num_inputs):
-            key = f"in{i+1}"
+        for key in self._input_keys:
             u = self.inputs[key]
             if u is None:
                 raise RuntimeError(f"[{self.name}] Input '{key}' is not connected or not set.")
 
             vectors.append(self._to_column_vector(key, u))
 
-        return np.vstack(vectors)
+        # inputs are already (n,1): concatenate without vstack's per-input atleast_2d
+        return np.concatenate(vectors)
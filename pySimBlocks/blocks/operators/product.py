@@ -94,8 +94,9 @@ class Product(Block):
         self.multiplication = multiplication
         self.num_inputs = len(self.operations) + 1
 
-        for i in range(self.num_inputs):
-            self.inputs[f"in{i+1}"] = None
+        self._input_keys = tuple(f"in{i+1}" for i in range(self.num_inputs))
+        for key in self._input_keys:
+            self.inputs[key] = None
 
         self.outputs["out"] = None
 
@@ -112,8 +113,8 @@ class Product(Block):
         Args:
             t0: Initial simulation time in seconds.
         """
-        for i in range(self.num_inputs):
-            if self.inputs[f"in{i+1}"] is None:
+        for key in self._input_keys:
+            if self.inputs[key] is None:
                 self.outputs["out"] = None
                 return
         self.outputs["out"] = self._compute_output()
@@ -162,7 +163,7 @@ class Product(Block):
 
     def _compute_output(self) -> np.ndarray:
         """Compute the product of all inputs according to the multiplication mode."""
-        arrays = [self._get_input_2d(f"in{i+1}") for i in range(self.num_inputs)]
+        arrays = [self._get_input_2d(key) for key in self._input_keys]
 
         if self.multiplication == "Element-wise (*)":
             non_scalar_shapes = {a.shape for a in arrays if not self._is_scalar_2d(a)}
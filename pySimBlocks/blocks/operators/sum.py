@@ -22,7 +22,7 @@ from __future__ import annotations
 
 import numpy as np
 
-from pySimBlocks.core.block import Block
+from pySimBlocks.core.block import Block, FLOAT64
 
 
 class Sum(Block):
@@ -76,9 +76,12 @@ class Sum(Block):
 
         self.signs = [1.0 if s == "+" else -1.0 for s in signs]
         self.num_inputs = len(self.signs)
+        self._sign_vector = np.asarray(self.signs, dtype=float)
+        self._stack: np.ndarray | None = None
 
-        for i in range(self.num_inputs):
-            self.inputs[f"in{i+1}"] = None
+        self._input_keys = tuple(f"in{i+1}" for i in range(self.num_inputs))
+        for key in self._input_keys:
+            self.inputs[key] = None
 
         self.outputs["out"] = None
 
@@ -93,7 +96,7 @@ class Sum(Block):
         Args:
             t0: Initial simulation time in seconds.
         """
-        if any(self.inputs[f"in{i+1}"] is None for i in range(self.num_inputs)):
+        if any(self.inputs[key] is None for key in self._input_keys):
             self.outputs["out"] = None
             return
 
@@ -111,21 +114,30 @@ class Sum(Block):
             ValueError: If any input is not 2D or non-scalar inputs have
                 inconsistent shapes.
         """
+        stack = self._stack
+        stack_shape = None if stack is None else stack.shape[1:]
+
+        # inputs already at the stack shape need no shape resolution
+        same_shape = stack is not None
         arrays = []
-        for i in range(self.num_inputs):
-            key = f"in{i+1}"
+        for key in self._input_keys:
             u = self.inputs[key]
             if u is None:
                 raise RuntimeError(f"[{self.name}] Input '{key}' is not connected or not set.")
 
-            a = np.asarray(u, dtype=float)
-            if a.ndim != 2:
-                raise ValueError(
-                    f"[{self.name}] Input '{key}' must be a 2D array. Got ndim={a.ndim} with shape {a.shape}."
-                )
+            if type(u) is np.ndarray and u.dtype is FLOAT64:
+                a = u
+            else:
+                a = np.asarray(u, dtype=float)
+            if a.shape != stack_shape:
+                same_shape = False
+                if a.ndim != 2:
+                    raise ValueError(
+                        f"[{self.name}] Input '{key}' must be a 2D array. Got ndim={a.ndim} with shape {a.shape}."
+                    )
             arrays.append(a)
 
-        self.outputs["out"] = self._compute_output(prevalidated_arrays=arrays)
+        self.outputs["out"] = self._compute_output(prevalidated_arrays=arrays, same_shape=same_shape)
 
     def state_update(self, t: float, dt: float) -> None:
         """No-op: Sum is a stateless block.
@@ -156,32 +168,31 @@ class Sum(Block):
             f"{[a.shape for a in arrays]}. All non-scalar inputs must have the same shape."
         )
 
-    def _broadcast_scalar_only(self, arr: np.ndarray, target_shape: tuple[int, int], input_name: str) -> np.ndarray:
-        """Broadcast scalar (1,1) to target shape; reject non-scalar shape mismatches."""
-        if self._is_scalar_2d(arr):
-            if target_shape == (1, 1):
-                return arr.astype(float, copy=False)
-            return np.full(target_shape, float(arr[0, 0]), dtype=float)
-
-        if arr.shape != target_shape:
-            raise ValueError(
-                f"[{self.name}] Input '{input_name}' shape {arr.shape} is incompatible with target shape {target_shape}. "
-                f"Only scalar (1,1) inputs can be broadcast."
-            )
-        return arr.astype(float, copy=False)
-
-    def _compute_output(self, prevalidated_arrays: list[np.ndarray] | None = None) -> np.ndarray:
-        """Compute the signed element-wise sum with scalar-only broadcasting."""
+    def _compute_output(
+        self,
+        prevalidated_arrays: list[np.ndarray] | None = None,
+        same_shape: bool = False,
+    ) -> np.ndarray:
+        """Compute the signed element-wise sum with scalar-only broadcasting.
+
+        Inputs are copied into a reused (num_inputs, *shape) stack, scalar
+        inputs broadcasting on assignment, and reduced with one product
+        against the sign vector. ``same_shape`` tells that every input
+        already has the stack shape, which skips the shape resolution.
+        """
         if prevalidated_arrays is None:
-            arrays = [np.asarray(self.inputs[f"in{i+1}"], dtype=float) for i in range(self.num_inputs)]
+            arrays = [np.asarray(self.inputs[key], dtype=float) for key in self._input_keys]
         else:
             arrays = prevalidated_arrays
 
-        target_shape = self._resolve_common_shape(arrays)
-
-        total = np.zeros(target_shape, dtype=float)
-        for i, (s, a) in enumerate(zip(self.signs, arrays), start=1):
-            a2 = self._broadcast_scalar_only(a, target_shape, input_name=f"in{i}")
-            total += s * a2
+        stack = self._stack
+        if same_shape:
+            target_shape = stack.shape[1:]
+        else:
+            target_shape = self._resolve_common_shape(arrays)
+            if stack is None or stack.shape[1:] != target_shape:
+                stack = self._stack = np.empty((self.num_inputs, *target_shape), dtype=float)
+        for i, a in enumerate(arrays):
+            stack[i] = a
 
-        return total
+        return np.dot(self._sign_vector, stack.reshape(self.num_inputs, -1)).reshape(target_shape)
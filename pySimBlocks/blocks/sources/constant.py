@@ -64,7 +64,7 @@ class Constant(BlockSource):
         arr = self._to_2d_array("value", value, dtype=float)
 
         self.value = arr
-        self.outputs["out"] = arr.copy()
+        self._refresh_output()
 
 
     # --------------------------------------------------------------------------
@@ -74,10 +74,13 @@ class Constant(BlockSource):
     def initialize(self, t0: float) -> None:
         """Set the output to the constant value at t0.
 
+        Takes a read-only copy of value, which output_update then emits
+        without allocating.
+
         Args:
             t0: Initial simulation time in seconds.
         """
-        self.outputs["out"] = self.value.copy()
+        self._refresh_output()
 
     def output_update(self, t: float, dt: float) -> None:
         """Write the constant value to the output port.
@@ -86,4 +89,26 @@ class Constant(BlockSource):
             t: Current simulation time in seconds.
             dt: Current time step in seconds.
         """
-        self.outputs["out"] = self.value.copy()
+        # value reassigned during the run (e.g. a GUI slider): copy it again
+        if self.value is not self._src:
+            self._refresh_output()
+        else:
+            self.outputs["out"] = self._out
+
+
+    # --------------------------------------------------------------------------
+    # Private methods
+    # --------------------------------------------------------------------------
+
+    def _refresh_output(self) -> None:
+        """Take a read-only copy of value and write it to the output port."""
+        self._src = self.value
+        self._out = self._frozen_copy(self.value)
+        self.outputs["out"] = self._out
+
+    @staticmethod
+    def _frozen_copy(value: np.ndarray) -> np.ndarray:
+        """Return a read-only contiguous float copy of value."""
+        out = np.array(value, dtype=float, order="C")
+        out.setflags(write=False)
+        return out
@@ -18,6 +18,7 @@
 #  Authors: see Authors.txt
 # ******************************************************************************
 
+from bisect import bisect_right
 from pathlib import Path
 from typing import Any, Dict
 
@@ -105,10 +106,21 @@ class FileSource(BlockSource):
 
         self._time: np.ndarray | None = None
         self._samples = self._load_samples()
+        self._samples.setflags(write=False)
+        # timestamps as a list: bisect on Python floats is much cheaper per
+        # step than np.searchsorted on a scalar
+        self._time_list = None if self._time is None else self._time.tolist()
+        self._n_samples = self._samples.shape[0]
+        # (N, n, 1) view of the samples: each step emits a read-only (n, 1)
+        # row view, with no copy or reshape
+        self._rows = self._samples.reshape(self._n_samples, -1, 1)
         self._index = 0
         self._output_shape = (self._samples.shape[1], 1)
+        # emitted after the last sample when repeat is False
+        self._zero_out = np.zeros(self._output_shape, dtype=float)
+        self._zero_out.setflags(write=False)
 
-        self.outputs["out"] = np.zeros(self._output_shape, dtype=float)
+        self.outputs["out"] = self._zero_out
 
 
     # --------------------------------------------------------------------------
@@ -208,7 +220,7 @@ class FileSource(BlockSource):
 
         self._time = time
 
-        return arr.astype(float, copy=False)
+        return np.ascontiguousarray(arr, dtype=float)
 
     def _load_npz(self, path: Path) -> tuple[np.ndarray, np.ndarray | None]:
         """Load an array and optional time vector from an NPZ archive."""
@@ -229,7 +241,7 @@ class FileSource(BlockSource):
                     f"Available keys: {keys}"
                 )
 
-            arr = np.asarray(data[selected_key], dtype=float)
+            arr = data[selected_key]
             time = None
             if self.use_time:
                 if "time" not in data:
@@ -241,12 +253,17 @@ class FileSource(BlockSource):
             return arr, time
 
     def _load_npy(self, path: Path) -> tuple[np.ndarray, np.ndarray | None]:
-        """Load an array from a NPY file."""
+        """Load an array from a NPY file.
+
+        The file is memory-mapped read-only: a C-ordered float64 array is
+        used in place and only the rows played back are read from disk.
+        Other layouts are converted to float64 by ``_load_samples``.
+        """
         if self.key not in (None, ""):
             raise ValueError(
                 f"[{self.name}] key is not used for NPY input."
             )
-        return np.asarray(np.load(path), dtype=float), None
+        return np.load(path, mmap_mode="r"), None
 
     def _load_csv(self, path: Path) -> tuple[np.ndarray, np.ndarray | None]:
         """Load a column array and optional time vector from a CSV file."""
@@ -255,32 +272,45 @@ class FileSource(BlockSource):
                 f"[{self.name}] key is mandatory for CSV input and must be a column name."
             )
 
-        arr = np.genfromtxt(path, delimiter=",", names=True, dtype=float)
+        # genfromtxt only reads the header and first row, so column names are
+        # normalized as before; the data is parsed by the faster loadtxt
+        head = np.genfromtxt(path, delimiter=",", names=True, dtype=float, max_rows=1)
 
-        if arr.size == 0:
+        if head.size == 0:
             raise ValueError(f"[{self.name}] CSV file is empty.")
-        if arr.dtype.names is None:
+        names = head.dtype.names
+        if names is None:
             raise ValueError(
                 f"[{self.name}] CSV must contain a header row with column names."
             )
-        if self.key not in arr.dtype.names:
+        if self.key not in names:
             raise KeyError(
                 f"[{self.name}] column '{self.key}' not found in CSV. "
-                f"Available columns: {list(arr.dtype.names)}"
+                f"Available columns: {list(names)}"
             )
+        usecols = [names.index(self.key)]
+        if self.use_time:
+            if "time" not in names:
+                raise KeyError(
+                    f"[{self.name}] use_time=True requires CSV column 'time'."
+                )
+            usecols.append(names.index("time"))
+
+        try:
+            data = np.loadtxt(path, delimiter=",", skiprows=1, usecols=usecols, ndmin=2)
+        except ValueError as err:
+            raise ValueError(
+                f"[{self.name}] CSV column '{self.key}' contains non-numeric or missing values."
+            ) from err
 
-        col = np.asarray(arr[self.key], dtype=float).reshape(-1, 1)
+        col = data[:, :1]
         if np.isnan(col).any():
             raise ValueError(
                 f"[{self.name}] CSV column '{self.key}' contains non-numeric or missing values."
             )
         time = None
         if self.use_time:
-            if "time" not in arr.dtype.names:
-                raise KeyError(
-                    f"[{self.name}] use_time=True requires CSV column 'time'."
-                )
-            time = np.asarray(arr["time"], dtype=float).reshape(-1)
+            time = data[:, 1]
             self._validate_time(time, col.shape[0])
         return col, time
 
@@ -308,30 +338,25 @@ class FileSource(BlockSource):
 
     def _current_output(self) -> np.ndarray:
         """Return the sample at the current index, handling repeat and end-of-data."""
-        n = self._samples.shape[0]
-        if self._index < n:
-            idx = self._index
-        elif self.repeat:
-            idx = self._index % n
-        else:
-            return np.zeros(self._output_shape, dtype=float)
-
-        row = self._samples[idx]
-        return np.asarray(row, dtype=float).reshape(-1, 1)
+        idx = self._index
+        if idx < self._n_samples:
+            return self._rows[idx]
+        if self.repeat:
+            return self._rows[idx % self._n_samples]
+        return self._zero_out
 
     def _current_output_at_time(self, t: float) -> np.ndarray:
         """Return the sample corresponding to the nearest past timestamp."""
-        if self._time is None:
+        if self._time_list is None:
             raise RuntimeError(
                 f"[{self.name}] Internal error: use_time=True but time data is missing."
             )
 
-        idx = int(np.searchsorted(self._time, t, side="right") - 1)
+        idx = bisect_right(self._time_list, t) - 1
         if idx < 0:
             idx = 0
 
-        row = self._samples[idx]
-        return np.asarray(row, dtype=float).reshape(-1, 1)
+        return self._rows[idx]
 
     def _validate_time(self, time: np.ndarray, n_samples: int) -> None:
         """Validate that a time vector is 1D, strictly increasing, and matches n_samples."""
@@ -341,9 +366,11 @@ class FileSource(BlockSource):
             raise ValueError(
                 f"[{self.name}] time length ({time.shape[0]}) must match number of samples ({n_samples})."
             )
-        if np.isnan(time).any():
-            raise ValueError(f"[{self.name}] time contains NaN values.")
-        if not np.all(np.diff(time) > 0.0):
+        # any comparison with NaN is False, so one pass checks both; the
+        # first sample is tested alone for a single-sample time vector
+        if not np.all(time[1:] > time[:-1]) or np.isnan(time[0]):
+            if np.isnan(time).any():
+                raise ValueError(f"[{self.name}] time contains NaN values.")
             raise ValueError(
                 f"[{self.name}] time must be strictly increasing."
             )
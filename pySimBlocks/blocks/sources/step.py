@@ -20,6 +20,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 from numpy.typing import ArrayLike
 from pySimBlocks.core.block_source import BlockSource
 
@@ -90,13 +91,17 @@ class Step(BlockSource):
     def initialize(self, t0: float) -> None:
         """Set the output to value_before or value_after depending on t0.
 
+        Also takes read-only copies of both values, which output_update
+        then emits without allocating.
+
         Args:
             t0: Initial simulation time in seconds.
         """
+        self._refresh_values()
         self.outputs["out"] = (
-            self.value_before.copy()
+            self._out_before
             if t0 < self.start_time - self.EPS
-            else self.value_after.copy()
+            else self._out_after
         )
 
     def output_update(self, t: float, dt: float) -> None:
@@ -106,9 +111,34 @@ class Step(BlockSource):
             t: Current simulation time in seconds.
             dt: Current time step in seconds.
         """
+        # values reassigned during the run (e.g. a GUI slider): copy them again
+        if (
+            self.value_before is not self._src_before
+            or self.value_after is not self._src_after
+        ):
+            self._refresh_values()
         self.outputs["out"] = (
-            self.value_before.copy()
+            self._out_before
             if t < self.start_time - self.EPS
-            else self.value_after.copy()
+            else self._out_after
         )
 
+
+    # --------------------------------------------------------------------------
+    # Private methods
+    # --------------------------------------------------------------------------
+
+    def _refresh_values(self) -> None:
+        """Take read-only copies of value_before and value_after."""
+        self._src_before = self.value_before
+        self._src_after = self.value_after
+        self._out_before = self._frozen_copy(self.value_before)
+        self._out_after = self._frozen_copy(self.value_after)
+
+    @staticmethod
+    def _frozen_copy(value: np.ndarray) -> np.ndarray:
+        """Return a read-only contiguous float copy of value."""
+        out = np.array(value, dtype=float, order="C")
+        out.setflags(write=False)
+        return out
+
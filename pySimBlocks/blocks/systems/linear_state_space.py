@@ -37,6 +37,11 @@ class LinearStateSpace(Block):
 
     The D matrix is intentionally not supported to avoid algebraic loops.
 
+    An initial state of shape (n, N) simulates N independent trajectories
+    stacked as columns, updated with one matrix product per step. The input
+    is then either (m, N), one column per trajectory, or (m, 1), shared by
+    all trajectories.
+
     Attributes:
         A: State transition matrix of shape (n, n).
         B: Input matrix of shape (n, m).
@@ -61,8 +66,9 @@ class LinearStateSpace(Block):
             A: State transition matrix, array-like of shape (n, n).
             B: Input matrix, array-like of shape (n, m).
             C: Output matrix, array-like of shape (p, n).
-            x0: Initial state vector, array-like of shape (n, 1) or (n,).
-                Defaults to zeros.
+            x0: Initial state vector, array-like of shape (n, 1) or (n,),
+                or (n, N) for N trajectories stacked as columns. Defaults
+                to zeros.
             sample_time: Sampling period in seconds, or None to use the
                 global simulation dt.
 
@@ -100,6 +106,7 @@ class LinearStateSpace(Block):
         self._n = n
         self._m = self.B.shape[1]
         self._p = self.C.shape[0]
+        self._batch = 1
 
         if x0 is None:
             x0_arr = np.zeros((n, 1), dtype=float)
@@ -114,9 +121,13 @@ class LinearStateSpace(Block):
             else:
                 raise ValueError(f"[{self.name}] x0 must be 1D or 2D. Got shape {x0_arr.shape}.")
 
-            if x0_arr.shape != (n, 1):
-                raise ValueError(f"[{self.name}] x0 must have shape ({n}, 1). Got {x0_arr.shape}.")
+            if x0_arr.shape[0] != n:
+                raise ValueError(
+                    f"[{self.name}] x0 must have shape ({n}, 1) or ({n}, N). Got {x0_arr.shape}."
+                )
 
+        self._batch = x0_arr.shape[1]
+        self._x0 = x0_arr.copy()
         self.state["x"] = x0_arr.copy()
         self.next_state["x"] = x0_arr.copy()
 
@@ -130,12 +141,19 @@ class LinearStateSpace(Block):
     # --------------------------------------------------------------------------
 
     def initialize(self, t0: float) -> None:
-        """Compute initial outputs from the initial state.
+        """Reset the state to x0 and compute initial outputs from it.
+
+        Also stacks ``[A B]`` and allocates the ``[x; u]`` buffer so that the
+        state update is a single matrix-vector product.
 
         Args:
             t0: Initial simulation time in seconds.
         """
-        x = self.state["x"]
+        self._AB = np.hstack((self.A, self.B))
+        self._xu = np.empty((self._n + self._m, self._batch), dtype=float)
+
+        x = self._x0.copy()
+        self.state["x"] = x
         self.outputs["y"] = self.C @ x
         self.outputs["x"] = x.copy()
         self.next_state["x"] = x.copy()
@@ -143,13 +161,16 @@ class LinearStateSpace(Block):
     def output_update(self, t: float, dt: float) -> None:
         """Compute y and x outputs from the committed state.
 
+        The committed state is a fresh array after each commit and is never
+        modified in place, so it is exposed on output ``x`` without a copy.
+
         Args:
             t: Current simulation time in seconds.
             dt: Current time step in seconds.
         """
         x = self.state["x"]
         self.outputs["y"] = self.C @ x
-        self.outputs["x"] = x.copy()
+        self.outputs["x"] = x
 
     def state_update(self, t: float, dt: float) -> None:
         """Compute the next state x[k+1] = A x[k] + B u[k].
@@ -166,18 +187,20 @@ class LinearStateSpace(Block):
         if u is None:
             raise RuntimeError(f"[{self.name}] Input 'u' is not connected or not set.")
 
-        u_vec = self._to_col_vec("u", u, self._m)
-        x = self.state["x"]
+        u_vec = self._to_input(u)
+        xu = self._xu
+        xu[:self._n] = self.state["x"]
+        xu[self._n:] = u_vec
 
-        self.next_state["x"] = self.A @ x + self.B @ u_vec
+        np.matmul(self._AB, xu, out=self.next_state["x"])
 
 
     # --------------------------------------------------------------------------
     # Private methods
     # --------------------------------------------------------------------------
 
-    def _to_col_vec(self, name: str, value: ArrayLike, expected_rows: int) -> np.ndarray:
-        """Normalize value to a (n,1) column vector and validate its size."""
+    def _to_input(self, value: ArrayLike) -> np.ndarray:
+        """Normalize u to a (m,1) or (m,N) 2D array and validate its size."""
         arr = np.asarray(value, dtype=float)
 
         if arr.ndim == 0:
@@ -187,14 +210,19 @@ class LinearStateSpace(Block):
         elif arr.ndim == 2:
             pass
         else:
-            raise ValueError(f"[{self.name}] {name} must be 1D or 2D. Got shape {arr.shape}.")
-
-        if arr.shape[1] != 1:
-            raise ValueError(f"[{self.name}] {name} must be a column vector (k,1). Got {arr.shape}.")
-
-        if arr.shape[0] != expected_rows:
-            raise ValueError(
-                f"[{self.name}] {name} must have shape ({expected_rows},1). Got {arr.shape}."
-            )
+            raise ValueError(f"[{self.name}] u must be 1D or 2D. Got shape {arr.shape}.")
+
+        m, N = self._m, self._batch
+        if arr.shape[1] not in (1, N):
+            if N == 1:
+                raise ValueError(f"[{self.name}] u must be a column vector (k,1). Got {arr.shape}.")
+            raise ValueError(f"[{self.name}] u must have shape ({m},1) or ({m},{N}). Got {arr.shape}.")
+
+        if arr.shape[0] != m:
+            if N == 1:
+                raise ValueError(
+                    f"[{self.name}] u must have shape ({m},1). Got {arr.shape}."
+                )
+            raise ValueError(f"[{self.name}] u must have shape ({m},1) or ({m},{N}). Got {arr.shape}.")
 
         return arr
@@ -344,17 +344,22 @@ class SofaPysimBlocksController(Sofa.Core.Controller):
                     self._plot_data[f"{block_name}.{key}"].addData(name=f"value{i}", type="float", value=value[i])
                     MyGui.PlottingWindow.addData(f"{block_name}.{key}[{i}]", self._plot_data[f"{block_name}.{key}"].getData(f"value{i}"))
 
+        # resolve blocks and data handles once for the per-step update
+        self._plot_targets = []
+        for name, node in self._plot_data.items():
+            block_name, key = name.split(".")
+            block = self.get_block(block_name)
+            handles = [node.getData(f"value{i}") for i in range(block.outputs[key].size)]
+            self._plot_targets.append((block, key, handles))
+
     def _update_sofa_plot(self) -> None:
         """Update ImGui plot values for the configured signals."""
         if not self._imgui:
             return
 
-        for name, node in self._plot_data.items():
-            block_name, key = name.split(".")
-            block = self.get_block(block_name)
-            value = block.outputs[key].flatten()
-            for i in range(len(value)):
-                node.getData(f"value{i}").value = float(value[i])
+        for block, key, handles in self._plot_targets:
+            for d, v in zip(handles, block.outputs[key].ravel()):
+                d.value = float(v)
 
     def _set_sofa_slider(self) -> None:
         """Set up ImGui slider nodes for the configured block attributes."""
@@ -369,31 +374,29 @@ class SofaPysimBlocksController(Sofa.Core.Controller):
 
         self._slider_node = self.node.addChild("SLIDERS")
         self._slider_data = {}
+        self._slider_targets = []
         for var, extremum in data.items():
             block_name, key = var.split(".")
             node = self._slider_node.addChild(f"{block_name}_{key}")
             block = self.get_block(block_name)
             value = getattr(block, key)
             self._slider_data[f"{block_name}.{key}"] = {"node": node, "shape": value.shape}
+            shape = value.shape
             value = value.flatten()
+            handles = []
             for i in range(len(value)):
                 d = node.addData(name=f"value{i}", type="float", value=value[i])
                 MyGui.MyRobotWindow.addSettingInGroup(f"{key}[{i}]", d, extremum[0], extremum[1], f"{block_name}")
+                handles.append(node.getData(f"value{i}"))
+            self._slider_targets.append((block, key, shape, handles))
 
     def _update_sofa_slider(self) -> None:
         """Read ImGui slider values and apply them to the corresponding block attributes."""
         if not self._imgui:
             return
 
-        for var in self._slider_data:
-            block_name, key = var.split(".")
-            block = self.get_block(block_name)
-            node = self._slider_data[var]["node"]
-            shape = self._slider_data[var]["shape"]
-            new_values = []
-            for i in range(np.prod(shape)):
-                new_values.append(node.getData(f"value{i}").value)
-            setattr(block, key, np.array(new_values).reshape(shape))
+        for block, key, shape, handles in self._slider_targets:
+            setattr(block, key, np.array([d.value for d in handles]).reshape(shape))
 
     def _adapt_model_for_sofa(self, model_data: Dict[str, Any]) -> Dict[str, Any]:
         """Replace any SofaPlant block with a SofaExchangeIO block.
@@ -200,6 +200,7 @@ class SofaPlant(Block):
 
         self.process = None
         self.conn = None
+        self._step_pending = False
 
 
     # --------------------------------------------------------------------------
@@ -258,6 +259,7 @@ class SofaPlant(Block):
         """
         parent_conn, child_conn = Pipe()
         self.conn = parent_conn
+        self._step_pending = False
 
         self.process = Process(
             target=sofa_worker,
@@ -284,7 +286,10 @@ class SofaPlant(Block):
             self.outputs[key] = self.state[key]
 
     def state_update(self, t: float, dt: float) -> None:
-        """Send inputs to SOFA, advance one step, and store the new outputs.
+        """Send inputs to SOFA so that it starts advancing one step.
+
+        The worker's reply is only collected in commit_state, so the SOFA
+        step runs while the other blocks compute their state updates.
 
         Args:
             t: Current simulation time in seconds.
@@ -304,11 +309,21 @@ class SofaPlant(Block):
             msg["inputs"][k] = val
 
         self.conn.send(msg)
+        self._step_pending = True
 
-        outputs = self._recv_or_raise(timeout=5.)
+    def commit_state(self) -> None:
+        """Collect the SOFA step started in state_update, then commit it.
 
-        for k in self.output_keys:
-            self.next_state[k] = outputs[k]
+        Raises:
+            RuntimeError: If the SOFA worker times out or reports an error.
+        """
+        if self._step_pending:
+            self._step_pending = False
+            outputs = self._recv_or_raise(timeout=5.)
+            for k in self.output_keys:
+                self.next_state[k] = outputs[k]
+
+        super().commit_state()
 
     def finalize(self) -> None:
         """Shut down the SOFA worker process cleanly."""
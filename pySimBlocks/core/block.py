@@ -25,6 +25,11 @@ from typing import Any, Dict
 import numpy as np
 
 
+# Native float64 dtype. Built-in dtypes are singletons, so signal fast paths
+# test ``arr.dtype is FLOAT64``, which is cheaper than ``== np.float64``.
+FLOAT64 = np.dtype(np.float64)
+
+
 class Block(ABC):
     """Base class for all discrete-time blocks (Simulink-like).
  
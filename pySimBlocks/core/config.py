@@ -51,10 +51,16 @@ class SimulationConfig:
     #: Clock source, either ``"internal"`` or ``"external"``.
     clock: str = "internal" 
 
+    #: Storage dtype of logged signals, ``"float64"`` or ``"float32"``.
+    #: None keeps the dtype of each signal. Blocks always compute in their
+    #: own dtype; ``"float32"`` halves the memory used by long logs.
+    log_dtype: str | None = None
+
     def validate(self) -> None:
         """Verify that the configuration is consistent.
  
-        Checks that dt > 0, T > t0, solver and clock are known values.
+        Checks that dt > 0, T > t0, solver, clock and log_dtype are known
+        values.
  
         Raises:
             ValueError: If any parameter is invalid or out of range.
@@ -77,6 +83,12 @@ class SimulationConfig:
                 "Allowed values: {'internal', 'external'}"
             )
 
+        if self.log_dtype not in {None, "float64", "float32"}:
+            raise ValueError(
+                f"Unknown log_dtype '{self.log_dtype}'. "
+                "Allowed values: {None, 'float64', 'float32'}"
+            )
+
 
 @dataclass
 class PlotConfig:
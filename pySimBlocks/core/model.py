@@ -22,6 +22,8 @@ from collections import deque
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+import numpy as np
+
 from pySimBlocks.core.block import Block
 
 # A connection is:
@@ -71,6 +73,7 @@ class Model:
 
         self._output_execution_order: List[Block] = []
         self._state_execution_order: List[Block] = []
+        self._order_dirty: bool = True
 
         self._downstream_map: Dict[str, List[Connection]] = {}
         self._connections_dirty: bool = True
@@ -99,6 +102,7 @@ class Model:
             raise ValueError(f"Block name '{block.name}' already exists.")
 
         self.blocks[block.name] = block
+        self._order_dirty = True
         return block
 
     def get_block_by_name(self, name: str) -> Block:
@@ -150,6 +154,55 @@ class Model:
             ((src_block, src_port), (dst_block, dst_port))
         )
         self._connections_dirty = True
+        self._order_dirty = True
+
+    def set_params(self, params: Dict[str, Any]) -> None:
+        """Update block parameters without rebuilding the model.
+
+        Array parameters are overwritten in place and must keep their shape
+        (a scalar is accepted for a single-element array); numeric scalar
+        parameters are replaced by a value of the same type. Blocks and
+        connections are left untouched, so an existing Simulator can rerun
+        the model with the new values. Changes take effect at the next
+        ``Simulator.run()`` or ``initialize()``.
+
+        Args:
+            params: Mapping from ``"block.attribute"`` (e.g. ``"Kp.gain"``,
+                ``"motor.A"``) to the new value.
+
+        Raises:
+            ValueError: If a key is malformed, names an unknown block or a
+                private or missing attribute, or if the new value does not
+                match the type or shape of the current one.
+        """
+        for key, value in params.items():
+            block_name, _, attr = key.partition(".")
+            block = self.get_block_by_name(block_name)
+
+            if not attr or attr.startswith("_") or not hasattr(block, attr):
+                raise ValueError(
+                    f"Invalid parameter '{key}': expected 'block.attribute' "
+                    f"with a public attribute of block '{block_name}'."
+                )
+
+            current = getattr(block, attr)
+            if isinstance(current, np.ndarray):
+                new = np.asarray(value, dtype=current.dtype)
+                if new.size == 1 == current.size:
+                    new = new.reshape(current.shape)
+                if new.shape != current.shape:
+                    raise ValueError(
+                        f"[{block_name}] Parameter '{attr}' must keep shape {current.shape}. "
+                        f"Got {new.shape}."
+                    )
+                np.copyto(current, new)
+            elif isinstance(current, (int, float)) and not isinstance(current, bool) and np.ndim(value) == 0:
+                setattr(block, attr, type(current)(value))
+            else:
+                raise ValueError(
+                    f"[{block_name}] Parameter '{attr}' of type {type(current).__name__} "
+                    "cannot be updated without rebuilding the block."
+                )
 
     def build_execution_order(self):
         """Build the Simulink-like output execution order.
@@ -248,6 +301,7 @@ class Model:
 
         # Final storage
         self._output_execution_order = [blocks[n] for n in execution_order]
+        self._order_dirty = False
 
         return self._output_execution_order
 
@@ -269,11 +323,14 @@ class Model:
 
     def execution_order(self) -> List[Block]:
         """Return the output execution order, building it if necessary.
+
+        The order is cached and only rebuilt after a block or connection has
+        been added, so repeated simulators on the same model skip the sort.
  
         Returns:
             Ordered list of blocks for output_update execution.
         """
-        if not self._output_execution_order:
+        if self._order_dirty:
             return self.build_execution_order()
         return self._output_execution_order
 
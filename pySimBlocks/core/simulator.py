@@ -74,6 +74,8 @@ class Simulator:
         self._compile()
 
         self.logs: Dict[str, List[np.ndarray]] = {"time": []}
+        self._log_buffers: Dict[str, np.ndarray] = {}
+        self._log_slots: Dict[tuple[str, ...], list] = {}
 
 
     # --------------------------------------------------------------------------
@@ -93,6 +95,8 @@ class Simulator:
         self.t_step = float(t0)
         self.logs = {"time": []}
         self._log_shapes: Dict[str, tuple[int, int]] = {}
+        self._log_buffers: Dict[str, np.ndarray] = {}
+        self._log_slots: Dict[tuple[str, ...], list] = {}
 
         for block in self.output_order:
             try:
@@ -143,11 +147,12 @@ class Simulator:
         active_tasks = self.scheduler.active_tasks()
 
         # PHASE 1 — outputs
+        propagate = self._propagate_from
         for task in active_tasks:
             dt_task = task.accumulated_dt 
             for block in task.output_blocks:
                 block.output_update(self.t, dt_task)
-                self._propagate_from(block)
+                propagate(block)
 
         # PHASE 2 — states
         for task in active_tasks:
@@ -202,14 +207,20 @@ class Simulator:
         self.initialize(t0_run)
 
         eps = 1e-12
+        capacity = max(int(np.ceil((sim_duration - t0_run) / self.sim_cfg.dt)), 0) + 1
+        slots = self._resolve_log_slots(logging_run)
+        k = 0
         while self.t_step < sim_duration - eps:
             self.step()
-            self._log(logging_run)
+            self._record(slots, k, capacity)
 
             if self.verbose:
                 print(f"\nTime: {self.t_step}/{sim_duration}")
                 for variable in logging_run:
-                    print(f"{variable}: {self.logs[variable][-1]}")
+                    print(f"{variable}: {self._log_buffers[variable][k]}")
+            k += 1
+
+        self._publish_log_buffers(k)
 
         for block in self.model.blocks.values():
             try:
@@ -237,7 +248,8 @@ class Simulator:
  
         Returns:
             Array of shape ``(n_steps, *signal_shape)`` containing the
-            logged values.
+            logged values. After ``run``, this is a view on the contiguous
+            log buffer rather than a copy.
  
         Raises:
             ValueError: If neither variable nor (block, port) is provided,
@@ -260,9 +272,15 @@ class Simulator:
         length = len(data)
         if length == 0:
             raise ValueError(f"Log for variable '{var_name}' is empty.")
+
+        buffer = self._log_buffers.get(var_name)
+        if buffer is not None and buffer.shape[0] == length:
+            return buffer
+
         shape = data[0].shape
         try:
-            data_array = np.array(data).reshape(length, *shape)
+            data_array = np.empty((length, *shape), dtype=data[0].dtype)
+            np.stack(data, out=data_array)
         except Exception as e:
             raise ValueError(f"Failed to convert log data for variable '{var_name}' to numpy array: {e}") from e
 
@@ -275,16 +293,24 @@ class Simulator:
     def _compile(self) -> None:
         """Prepare the simulator for execution.
  
-        Builds execution order, groups blocks into tasks by sample time,
-        and initializes the scheduler and time manager.
+        Builds execution order, resolves the output-to-input link table,
+        groups blocks into tasks by sample time, and initializes the
+        scheduler and time manager.
  
         Raises:
             NotImplementedError: If solver is ``"variable"``.
             ValueError: If solver is unknown.
         """
-        self.output_order = self.model.build_execution_order()
+        self.output_order = self.model.execution_order()
         self.model.resolve_sample_times(self.sim_cfg.dt)
         self.model._rebuild_downstream_map()
+        self._links = {
+            name: [
+                (src_port, self.model.blocks[dst_block].inputs, dst_port)
+                for ((_, src_port), (dst_block, dst_port)) in self.model.downstream_of(name)
+            ]
+            for name in self.model.blocks
+        }
         sample_times = [b._effective_sample_time for b in self.model.blocks.values()]
 
         tasks_by_ts = {}
@@ -318,17 +344,22 @@ class Simulator:
             )
 
     def _propagate_from(self, block: Block) -> None:
-        """Forward outputs of block to its direct downstream inputs."""
-        blocks = self.model.blocks
-        for (src, dst) in self.model.downstream_of(block.name):
-            _, src_port = src
-            dst_block, dst_port = dst
-            value = block.outputs[src_port]
+        """Forward outputs of block to its direct downstream inputs.
+
+        Uses the link table resolved in ``_compile`` so that no connection
+        lookup or tuple unpacking happens on the per-step path.
+        """
+        outputs = block.outputs
+        for src_port, dst_inputs, dst_port in self._links[block.name]:
+            value = outputs[src_port]
             if value is not None:
-                blocks[dst_block].inputs[dst_port] = value
+                dst_inputs[dst_port] = value
 
     def _log(self, variables_to_log: List[str]) -> None:
-        """Log specified variables at the current timestep.
+        """Append specified variables at the current timestep to the logs.
+
+        Used when the simulation is stepped from outside (e.g. a SOFA
+        controller). ``run`` writes into preallocated buffers instead.
  
         Raises:
             ValueError: If a variable format is invalid or the container
@@ -336,42 +367,128 @@ class Simulator:
             RuntimeError: If a logged value is None, not 2D, or changes
                 shape across timesteps.
         """
+        slots = self._log_slots.get(tuple(variables_to_log))
+        if slots is None:
+            slots = self._log_slots[tuple(variables_to_log)] = self._resolve_log_slots(variables_to_log)
+
+        for var, source, key in slots:
+            arr = self._read_log_value(var, source, key)
+            if var not in self.logs:
+                self.logs[var] = []
+            self.logs[var].append(np.array(arr, dtype=self.sim_cfg.log_dtype))
+
+        self.logs["time"].append(np.array([self.t_step]))
+
+    def _record(self, slots: list, k: int, capacity: int) -> None:
+        """Write the logged slots at step k into the run log buffers.
+
+        Buffers of shape ``(capacity, *signal_shape)`` are allocated at the
+        first step, once signal shapes are known, and grown if the run
+        takes more steps than expected.
+ 
+        Raises:
+            RuntimeError: If a logged value is None, not 2D, or changes
+                shape across timesteps.
+        """
+        buffers = self._log_buffers
+        log_dtype = self.sim_cfg.log_dtype
+        for var, source, key in slots:
+            arr = self._read_log_value(var, source, key)
+            dtype = arr.dtype if log_dtype is None else log_dtype
+            buf = buffers.get(var)
+            if buf is None:
+                buf = buffers[var] = np.empty((capacity, *arr.shape), dtype=dtype)
+            elif k == buf.shape[0] or (
+                dtype != buf.dtype and np.result_type(buf.dtype, dtype) != buf.dtype
+            ):
+                # a dtype the buffer already holds (e.g. int into float) is
+                # cast on write; only a wider dtype regrows the buffer
+                buf = buffers[var] = self._grow_buffer(buf, k, dtype)
+            buf[k] = arr
+
+        time_buf = buffers.get("time")
+        if time_buf is None:
+            time_buf = buffers["time"] = np.empty((capacity, 1))
+        elif k == time_buf.shape[0]:
+            time_buf = buffers["time"] = self._grow_buffer(time_buf, k, time_buf.dtype)
+        time_buf[k, 0] = self.t_step
+
+    @staticmethod
+    def _grow_buffer(buf: np.ndarray, k: int, dtype: np.dtype) -> np.ndarray:
+        """Return a copy of the first k rows of buf with room for row k.
+
+        The dtype is promoted if needed so that a later value is never
+        silently truncated.
+        """
+        rows = 2 * buf.shape[0] if k == buf.shape[0] else buf.shape[0]
+        grown = np.empty((rows, *buf.shape[1:]), dtype=np.result_type(buf.dtype, dtype))
+        grown[:k] = buf[:k]
+        return grown
+
+    def _publish_log_buffers(self, n_steps: int) -> None:
+        """Trim the run log buffers to n_steps and expose them in self.logs.
+
+        Each log entry stays a list of per-step arrays, but the arrays are
+        views on one contiguous buffer that ``get_data`` returns directly.
+        """
+        for var, buf in self._log_buffers.items():
+            buf = self._log_buffers[var] = buf[:n_steps]
+            self.logs[var] = list(buf)
+
+    def _resolve_log_slots(self, variables_to_log: List[str]) -> list:
+        """Resolve variable names into (name, container, key) slots.
+
+        The container is the block's ``outputs`` or ``state`` dict, so the
+        per-step logging path reads values without parsing names.
+
+        Raises:
+            ValueError: If a variable format is invalid or the container
+                is unknown.
+        """
+        slots = []
         for var in variables_to_log:
             block_name, container, key = var.split(".")
             block = self.model.blocks[block_name]
 
             if container == "outputs":
-                value = block.outputs[key]
+                source = block.outputs
             elif container == "state":
-                value = block.state[key]
+                source = block.state
             else:
                 raise ValueError(f"Unknown container '{container}' in '{var}'.")
+            slots.append((var, source, key))
+        return slots
 
-            if value is None:
-                raise RuntimeError(
-                    f"[Simulator] Cannot log '{var}' at t={self.t_step}: value is None."
-                )
+    def _read_log_value(self, var: str, source: Dict[str, np.ndarray], key: str) -> np.ndarray:
+        """Return the current value of a logged slot as a 2D array.
+ 
+        Raises:
+            RuntimeError: If the value is None, not 2D, or changes shape
+                across timesteps.
+        """
+        value = source[key]
 
-            arr = np.asarray(value)
+        if value is None:
+            raise RuntimeError(
+                f"[Simulator] Cannot log '{var}' at t={self.t_step}: value is None."
+            )
 
-            if arr.ndim != 2:
-                raise RuntimeError(
-                    f"[Simulator] Cannot log '{var}' at t={self.t_step}: expected a 2D array, "
-                    f"got ndim={arr.ndim} with shape {arr.shape}."
-                )
+        arr = np.asarray(value)
 
-            if var not in self._log_shapes:
-                self._log_shapes[var] = arr.shape
-            else:
-                expected_shape = self._log_shapes[var]
-                if arr.shape != expected_shape:
-                    raise RuntimeError(
-                        f"[Simulator] Logged signal '{var}' changed shape over time at t={self.t_step}: "
-                        f"expected {expected_shape}, got {arr.shape}."
-                    )
+        if arr.ndim != 2:
+            raise RuntimeError(
+                f"[Simulator] Cannot log '{var}' at t={self.t_step}: expected a 2D array, "
+                f"got ndim={arr.ndim} with shape {arr.shape}."
+            )
 
-            if var not in self.logs:
-                self.logs[var] = []
-            self.logs[var].append(np.copy(arr))
+        if var not in self._log_shapes:
+            self._log_shapes[var] = arr.shape
+        else:
+            expected_shape = self._log_shapes[var]
+            if arr.shape != expected_shape:
+                raise RuntimeError(
+                    f"[Simulator] Logged signal '{var}' changed shape over time at t={self.t_step}: "
+                    f"expected {expected_shape}, got {arr.shape}."
+                )
 
-        self.logs["time"].append(np.array([self.t_step]))
+        return arr
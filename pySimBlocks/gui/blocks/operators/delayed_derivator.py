@@ -0,0 +1,82 @@
+# ******************************************************************************
+#                                  pySimBlocks
+#                     Copyright (c) 2026 Université de Lille & INRIA
+# ******************************************************************************
+#  This program is free software: you can redistribute it and/or modify it
+#  under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or (at your
+#  option) any later version.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+#  FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+#  for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ******************************************************************************
+#  Authors: see Authors.txt
+# ******************************************************************************
+
+from pySimBlocks.gui.blocks.block_meta import BlockMeta
+from pySimBlocks.gui.blocks.parameter_meta import ParameterMeta
+from pySimBlocks.gui.blocks.port_meta import PortMeta
+
+
+class DelayedDerivatorMeta(BlockMeta):
+    """Describe the GUI metadata of the delayed derivator block."""
+
+    def __init__(self):
+        """Initialize delayed derivator block metadata.
+
+        Args:
+            None.
+
+        Raises:
+            None.
+        """
+        self.name = "DelayedDerivator"
+        self.category = "operators"
+        self.type = "delayed_derivator"
+        self.summary = "Finite difference of an N-step delayed signal."
+        self.description = (
+            "Equivalent to a Delay followed by a DiscreteDerivator:\n"
+            "$$\n"
+            "y[k] = \\frac{u[k - N] - u[k - N - 1]}{dt}\n"
+            "$$\n"
+        )
+
+        self.parameters = [
+            ParameterMeta(
+                name="num_delays",
+                type="int",
+                autofill=True,
+                default=1
+            ),
+            ParameterMeta(
+                name="initial_output",
+                type="scalar | vector | matrix"
+            ),
+            ParameterMeta(
+                name="sample_time",
+                type="float"
+            )
+        ]
+
+        self.inputs = [
+            PortMeta(
+                name="in",
+                display_as="in",
+                shape=["n", "m"],
+                description="Input signal."
+            )
+        ]
+
+        self.outputs = [
+            PortMeta(
+                name="out",
+                display_as="out",
+                shape=["n", "m"],
+                description="Derivative of the delayed signal."
+            )
+        ]
@@ -62,7 +62,7 @@ class DiscreteIntegratorMeta(BlockMeta):
                 type="enum",
                 autofill=True,
                 default="euler forward",
-                enum=["euler forward", "euler backward"]
+                enum=["euler forward", "euler backward", "trapezoidal"]
             ),
             ParameterMeta(
                 name="sample_time",
@@ -61,6 +61,10 @@ class PlotDialog(QDialog):
         self.project_state = project_state
         self.selected_signals: set[str] = set()
 
+        # logs do not change while the dialog is open: stacked samples are
+        # built once per signal and reused on every preview redraw
+        self._stacked_signals: dict[str, np.ndarray] = {}
+
         self._build_ui()
         self._populate_signals()
 
@@ -184,7 +188,10 @@ class PlotDialog(QDialog):
 
         try:
             for sig in sorted(self.selected_signals):
-                data = self._stack_logged_signal_2d(sig)  # (T, m, n)
+                data = self._stacked_signals.get(sig)
+                if data is None:
+                    data = self._stack_logged_signal_2d(sig)  # (T, m, n)
+                    self._stacked_signals[sig] = data
 
                 if data.shape[0] != T:
                     raise ValueError(
@@ -178,10 +178,10 @@ class ProjectController(QObject):
         for connection in self.project_state.get_connections_of_block(block_instance):
             self.remove_connection(connection)
 
-        removed_signals = [
+        removed_signals = {
             f"{block_instance.name}.outputs.{p.name}"
             for p in block_instance.ports if p.direction == "output"
-        ]
+        }
         remaining_signals = [
             s for s in self.project_state.logging
             if s not in removed_signals
@@ -432,6 +432,8 @@ class ProjectController(QObject):
 
     def _ensure_logged(self, signals: list[str]) -> None:
         """Append any signal not yet in the logging list."""
+        logged = set(self.project_state.logging)
         for sig in signals:
-            if sig not in self.project_state.logging:
+            if sig not in logged:
                 self.project_state.logging.append(sig)
+                logged.add(sig)
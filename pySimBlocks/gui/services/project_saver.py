@@ -101,7 +101,7 @@ class ProjectSaverYaml(ProjectSaver):
             block_items if block_items is not None else {},
         )
         run_py = project_state.directory_path / "run.py"
-        run_py.write_text(
-            generate_python_content(project_yaml_path="project.yaml")
+        run_py.write_bytes(
+            generate_python_content(project_yaml_path="project.yaml").encode("utf-8")
         )
         
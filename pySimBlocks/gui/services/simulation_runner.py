@@ -20,6 +20,8 @@
 
 import os
 import sys
+from functools import lru_cache
+
 from pySimBlocks.gui.models import ProjectState
 from pySimBlocks.gui.services.yaml_tools import (
     cleanup_runtime_project_yaml,
@@ -69,7 +71,7 @@ class SimulationRunner:
         try:
             os.chdir(project_dir)
             sys.path.insert(0, str(project_dir))
-            exec(code, env, env)
+            exec(_compile_run_script(code), env, env)
             logs = env.get("logs")
             return logs, True, "Simulation success."
         except Exception as e:
@@ -79,3 +81,9 @@ class SimulationRunner:
             os.chdir(old_cwd)
             sys.path[:] = old_sys_path
             cleanup_runtime_project_yaml(project_dir)
+
+
+@lru_cache(maxsize=8)
+def _compile_run_script(code: str):
+    """Compile a generated run script, reusing the code object across runs."""
+    return compile(code, "<pySimBlocks run script>", "exec")
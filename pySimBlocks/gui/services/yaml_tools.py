@@ -25,6 +25,8 @@ import yaml
 from pySimBlocks.gui.graphics.block_item import BlockItem
 from pySimBlocks.gui.models.project_state import ProjectState
 
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_yaml_file(path: str) -> dict:
     """Load a YAML file and return its top-level mapping.
@@ -35,8 +37,8 @@ def load_yaml_file(path: str) -> dict:
     Returns:
         Parsed YAML mapping, or an empty dict for an empty file.
     """
-    with open(path, "r") as f:
-        return yaml.safe_load(f) or {}
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
 
 
 class FlowStyleList(list):
@@ -44,7 +46,7 @@ class FlowStyleList(list):
     pass
 
 
-class ProjectYamlDumper(yaml.SafeDumper):
+class ProjectYamlDumper(getattr(yaml, "CSafeDumper", yaml.SafeDumper)):
     """Custom YAML dumper for pySimBlocks project files."""
     pass
 
@@ -146,7 +148,7 @@ def save_yaml(
     project_raw = build_project_yaml(project_state, block_items if block_items is not None else {})
     directory.mkdir(parents=True, exist_ok=True)
     target = ".project.runtime.yaml" if runtime else "project.yaml"
-    (directory / target).write_text(dump_project_yaml(raw=project_raw))
+    (directory / target).write_bytes(dump_project_yaml(raw=project_raw).encode("utf-8"))
 
 
 def runtime_project_yaml_path(project_dir: Path) -> Path:
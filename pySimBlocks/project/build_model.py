@@ -21,12 +21,23 @@
 from __future__ import annotations
 
 import importlib
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 import yaml
 
 from pySimBlocks.core.model import Model
 
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=1)
+def _load_blocks_index() -> Dict[str, Any]:
+    """Load the block registry index, parsed once per process."""
+    index_path = Path(__file__).parent / "pySimBlocks_blocks_index.yaml"
+    with index_path.open("r") as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
 
 def build_model_from_dict(
     model: Model,
@@ -50,9 +61,7 @@ def build_model_from_dict(
     Raises:
         ValueError: If a block type or category is not found in the registry.
     """
-    index_path = Path(__file__).parent / "pySimBlocks_blocks_index.yaml"
-    with index_path.open("r") as f:
-        blocks_index = yaml.safe_load(f) or {}
+    blocks_index = _load_blocks_index()
 
     for desc in model_data.get("blocks", []):
         name = desc["name"]
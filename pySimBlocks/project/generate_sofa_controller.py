@@ -30,6 +30,8 @@ from pathlib import Path
 
 import yaml
 
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def _load_scene_in_subprocess(scene_path, conn) -> None:
     """Load a SOFA scene in a subprocess and send back the controller source file path."""
@@ -162,7 +164,7 @@ def _load_project_yaml(project_yaml: Path) -> dict:
     if not project_yaml.exists():
         raise FileNotFoundError(f"project.yaml not found: {project_yaml}")
 
-    raw = yaml.safe_load(project_yaml.read_text()) or {}
+    raw = yaml.load(project_yaml.read_text(), Loader=_YamlLoader) or {}
     if not isinstance(raw, dict):
         raise ValueError("project.yaml must define a YAML mapping")
     return raw
@@ -208,6 +208,7 @@ def load_project_config(
         solver=sim_eval_data.get("solver", "fixed"),
         logging=sim_data.get("logging", []),
         clock=sim_eval_data.get("clock", "internal"),
+        log_dtype=sim_data.get("log_dtype"),
     )
     sim_cfg.validate()
 
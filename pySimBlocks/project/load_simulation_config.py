@@ -28,6 +28,8 @@ import numpy as np
 import re
 from pySimBlocks.core.config import SimulationConfig
 
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def _load_yaml(path: Path) -> Dict[str, Any]:
     """Load and return a YAML file as a dict."""
@@ -35,7 +37,7 @@ def _load_yaml(path: Path) -> Dict[str, Any]:
         raise FileNotFoundError(f"Project file not found: {path}")
 
     with path.open("r") as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_YamlLoader) or {}
 
     if not isinstance(data, dict):
         raise ValueError("project.yaml must define a YAML mapping")
@@ -58,6 +60,7 @@ def _load_external_module(path: Path):
 
 
 _EXTERNAL_REF_PATTERN = re.compile(r"#([A-Za-z_][A-Za-z0-9_]*)")
+_LIST_OPEN_PATTERN = re.compile(r"(?<!np\.array)\[")
 
 
 def extract_external_refs(expr: str) -> set[str]:
@@ -121,7 +124,8 @@ def eval_value(value: Any, scope: dict) -> Any:
     The value is converted to string, ``#`` prefixes are stripped, bare list
     literals are wrapped in ``np.array()``, and the result is evaluated using
     ``eval`` with a restricted namespace containing only ``np`` and ``scope``.
-    If evaluation fails the original value is returned unchanged.
+    If evaluation fails the original value is returned unchanged. Numbers,
+    booleans and None are already literals and are returned as is.
 
     Args:
         value: Raw YAML value (string, number, list, etc.).
@@ -131,11 +135,15 @@ def eval_value(value: Any, scope: dict) -> Any:
     Returns:
         Evaluated Python object, or ``value`` unchanged if evaluation fails.
     """
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+
     try:
         expr = str(value)
         expr = expr.replace("#", "")
-        expr = re.sub(r'(?<!np\.array)\[', 'np.array([', expr)
-        expr = re.sub(r'\]', '])', expr)
+        if "[" in expr:
+            expr = _LIST_OPEN_PATTERN.sub("np.array([", expr)
+            expr = expr.replace("]", "])")
         return eval(expr, {"np": np}, scope)
     except Exception:
         return value
@@ -134,7 +134,7 @@ class RealTimeRunner:
             y = block.outputs["out"]
             if y is None:
                 raise RuntimeError(f"[RealTimeRunner] Output 'out' of block '{block_name}' is None")
-            outputs[block_name] = np.asarray(y, dtype=float).reshape(-1, 1)
+            outputs[block_name] = np.array(y, dtype=float).reshape(-1, 1)
 
         # 4) bookkeeping + pacing
         self._t_prev = t_now
@@ -0,0 +1,94 @@
+# tests/blocks/controllers/test_batched_pid.py
+
+import numpy as np
+import pytest
+
+from pySimBlocks.core import Model, Simulator, SimulationConfig
+from pySimBlocks.blocks.sources.step import Step
+from pySimBlocks.blocks.controllers.batched_pid import BatchedPid
+from pySimBlocks.blocks.controllers.pid import Pid
+
+
+# ------------------------------------------------------------
+# Helper
+# ------------------------------------------------------------
+def run_sim(value_before, value_after, ctrl_block, dt=0.1, T=0.5):
+    m = Model()
+    src = Step("src", start_time=0.2, value_before=value_before, value_after=value_after)
+    m.add_block(src)
+    m.add_block(ctrl_block)
+    m.connect("src", "out", ctrl_block.name, "e")
+
+    sim_cfg = SimulationConfig(dt, T, logging=[f"{ctrl_block.name}.outputs.u"])
+    sim = Simulator(m, sim_cfg)
+    logs = sim.run()
+    return np.array(logs[f"{ctrl_block.name}.outputs.u"])
+
+
+# ------------------------------------------------------------
+# 1) Each channel matches an individual Pid
+# ------------------------------------------------------------
+@pytest.mark.parametrize("method", ["euler forward", "euler backward"])
+def test_batched_pid_matches_individual_pids(method):
+    Kp = [1.0, 2.0, 0.5]
+    Ki = [0.5, 1.0, 2.0]
+    Kd = [0.1, 0.3, 0.2]
+    e_before = [0.0, 1.0, -1.0]
+    e_after = [1.0, -2.0, 3.0]
+
+    bpid = BatchedPid("bpid", controller="PID", Kp=Kp, Ki=Ki, Kd=Kd,
+                      u_max=2.5, integration_method=method)
+    logs = run_sim(np.c_[e_before], np.c_[e_after], bpid)
+
+    assert logs.shape[1:] == (3, 1)
+    for j in range(3):
+        pid = Pid("pid", controller="PID", Kp=Kp[j], Ki=Ki[j], Kd=Kd[j],
+                  u_max=2.5, integration_method=method)
+        expected = run_sim([[e_before[j]]], [[e_after[j]]], pid)
+        assert np.allclose(logs[:, j, 0], expected[:, 0, 0])
+
+
+# ------------------------------------------------------------
+# 2) Scalar parameters: channel count comes from the input
+# ------------------------------------------------------------
+def test_batched_pid_scalar_gains_take_size_from_input():
+    bpid = BatchedPid("bpid", controller="P", Kp=2.0, u_min=[[-1.0], [0.0]])
+    logs = run_sim([[0.0], [0.0]], [[-3.0], [4.0]], bpid, T=0.3)
+
+    assert np.allclose(logs[-1], [[-1.0], [8.0]])
+
+
+# ------------------------------------------------------------
+# 3) Inconsistent channel counts
+# ------------------------------------------------------------
+def test_batched_pid_parameter_length_mismatch_raises():
+    with pytest.raises(ValueError):
+        BatchedPid("bpid", controller="PI", Kp=[1.0, 2.0], Ki=[1.0, 2.0, 3.0])
+
+
+def test_batched_pid_input_length_mismatch_raises():
+    bpid = BatchedPid("bpid", controller="P", Kp=[1.0, 2.0])
+    with pytest.raises(ValueError) as err:
+        run_sim([[0.0], [0.0], [0.0]], [[1.0], [1.0], [1.0]], bpid)
+
+    assert "shape" in str(err.value)
+
+
+# ------------------------------------------------------------
+# 4) Saturation bounds reassigned during the run
+# ------------------------------------------------------------
+def test_batched_pid_saturation_bound_reassigned_during_run():
+    bpid = BatchedPid("bpid", controller="P", Kp=10.0, u_max=5.0)
+    bpid.inputs["e"] = np.array([[1.0], [1.0]])
+    bpid.initialize(0.0)
+    bpid.output_update(0.0, 0.1)
+    assert np.allclose(bpid.outputs["u"], [[5.0], [5.0]])
+
+    bpid.u_max = np.array([[2.0], [3.0]])
+    bpid.output_update(0.1, 0.1)
+    assert np.allclose(bpid.outputs["u"], [[2.0], [3.0]])
+
+    bpid.u_min = np.array([[12.0], [12.0]])
+    bpid.u_max = None
+    bpid.output_update(0.2, 0.1)
+    assert np.allclose(bpid.outputs["u"], [[12.0], [12.0]])
@@ -112,6 +112,24 @@ def test_pid_PI_forward():
     assert np.allclose(logs[3], [[2.3]])
 
 
+# ------------------------------------------------------------
+# 5b) PD derivative kick on a step, no integrator state
+# ------------------------------------------------------------
+def test_pid_PD_step_kick_and_no_integrator_state():
+    src = Step("e", start_time=0.1, value_before=0.0, value_after=1.0)
+    pid = Pid("pid", controller="PD", Kp=1.0, Kd=1.0, u_min=0.5)
+
+    logs = run_sim(src, pid, dt=0.1, T=0.3)
+
+    # k=0: e=0 -> u=max(0, 0.5)
+    # k=1: e=1 -> u=Kp*1 + Kd*(1-0)/dt = 11
+    # k=2: e=1 -> u=1
+    assert np.allclose(logs[0], [[0.5]])
+    assert np.allclose(logs[1], [[11.0]])
+    assert np.allclose(logs[2], [[1.0]])
+    assert np.allclose(pid.state["x_i"], [[0.0]])
+
+
 # ------------------------------------------------------------
 # 6) Saturation clamps output
 # ------------------------------------------------------------
@@ -125,6 +143,37 @@ def test_pid_saturation_upper_clamp():
     assert np.allclose(logs[1], [[3.0]])
 
 
+def test_pid_saturation_bound_updated_by_set_params():
+    src = Constant("e", -1.0)
+    pid = Pid("pid", controller="PI", Kp=100.0, Ki=1.0, u_min=-3.0)
+
+    m = Model()
+    m.add_block(src)
+    m.add_block(pid)
+    m.connect("e", "out", "pid", "e")
+    sim = Simulator(m, SimulationConfig(0.1, 0.2, logging=["pid.outputs.u"]))
+
+    sim.run()
+    assert np.allclose(sim.get_data("pid.outputs.u"), -3.0)
+
+    m.set_params({"pid.u_min": -2.0})
+    sim.run()
+    assert np.allclose(sim.get_data("pid.outputs.u"), -2.0)
+    assert np.allclose(pid.state["x_i"], [[-0.3]])
+
+
+def test_pid_saturation_bound_reassigned_during_run():
+    pid = Pid("pid", controller="P", Kp=10.0, u_max=5.0)
+    pid.inputs["e"] = np.array([[1.0]])
+    pid.initialize(0.0)
+    pid.output_update(0.0, 0.1)
+    assert np.allclose(pid.outputs["u"], [[5.0]])
+
+    setattr(pid, "u_max", np.array([[2.0]]))
+    pid.output_update(0.1, 0.1)
+    assert np.allclose(pid.outputs["u"], [[2.0]])
+
+
 # ------------------------------------------------------------
 # 7) Missing input raises at run (output_update)
 # ------------------------------------------------------------
@@ -141,3 +190,19 @@ def test_pid_missing_input_raises():
 
     with pytest.raises(RuntimeError):
         sim.run()
+
+
+# ------------------------------------------------------------
+# 8) State update uses the error present at state_update time
+# ------------------------------------------------------------
+def test_pid_state_update_reads_new_error_object():
+    pid = Pid("pid", controller="I", Ki=1.0)
+    pid.initialize(0.0)
+
+    pid.inputs["e"] = np.array([[1.0]])
+    pid.output_update(0.0, 0.1)
+    pid.inputs["e"] = np.array([[2.0]])
+    pid.state_update(0.0, 0.1)
+    pid.commit_state()
+
+    assert np.allclose(pid.state["x_i"], [[0.2]])
@@ -80,6 +80,23 @@ def test_algebraic_function_multiple_outputs():
     assert np.allclose(blk.outputs["y2"], 2.0 * u)
 
 
+def test_algebraic_function_arguments_in_declared_order():
+    # input_keys order differs from the function parameter order
+    def f(t, dt, b, a):
+        if a is None or b is None:
+            return {"y": np.zeros((1, 1))}
+        return {"y": a - b}
+
+    blk = make_block(f, input_keys=("a", "b"), output_keys=("y",))
+    blk.initialize(0.0)
+
+    blk.inputs["a"] = np.array([[5.0]])
+    blk.inputs["b"] = np.array([[2.0]])
+    blk.output_update(0.0, 0.1)
+
+    assert np.allclose(blk.outputs["y"], [[3.0]])
+
+
 # ---------------------------------------------------------------------
 # 4) Missing input -> RuntimeError
 # ---------------------------------------------------------------------
@@ -165,3 +165,52 @@ def test_delay_input_shape_change_over_time_raises():
         d.state_update(0.1, 0.1)
 
     assert "shape" in str(err.value) and "expected" in str(err.value)
+
+
+# ------------------------------------------------------------
+def test_delay_ring_buffer_wraps_around():
+    d = Delay("D", num_delays=3, initial_output=[[-1.0]])
+    d.inputs["in"] = np.array([[0.0]])
+    d.initialize(0.0)
+
+    outputs = []
+    for k in range(7):
+        d.inputs["in"] = np.array([[float(k)]])
+        d.output_update(0.1 * k, 0.1)
+        outputs.append(float(d.outputs["out"][0, 0]))
+        d.state_update(0.1 * k, 0.1)
+        d.commit_state()
+
+    assert outputs == [-1.0, -1.0, -1.0, 0.0, 1.0, 2.0, 3.0]
+    assert d.state["buffer"].shape == (4, 1, 1)
+
+
+# ------------------------------------------------------------
+def test_delay_output_is_read_only_and_survives_commit():
+    d = Delay("D", num_delays=1)
+    d.inputs["in"] = np.array([[1.0]])
+    d.initialize(0.0)
+
+    d.output_update(0.0, 0.1)
+    out = d.outputs["out"]
+    d.state_update(0.0, 0.1)
+    d.commit_state()
+
+    assert not out.flags.writeable
+    assert np.allclose(out, [[0.0]])
+
+    # The view is only valid until the next step: with num_delays=2 the
+    # slot kept at step 0 is rewritten by later commits.
+    d = Delay("D", num_delays=2)
+    d.initialize(0.0)
+    for k in range(5):
+        d.inputs["in"] = np.array([[float(k + 1)]])
+        d.output_update(0.1 * k, 0.1)
+        if k == 0:
+            out = d.outputs["out"]
+            kept = out.copy()
+        d.state_update(0.1 * k, 0.1)
+        d.commit_state()
+
+    assert np.allclose(kept, [[0.0]])
+    assert not np.allclose(out, kept)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from pySimBlocks.core import Model, Simulator, SimulationConfig
+from pySimBlocks.blocks.sources.sinusoidal import Sinusoidal
+from pySimBlocks.blocks.operators.delay import Delay
+from pySimBlocks.blocks.operators.delayed_derivator import DelayedDerivator
+from pySimBlocks.blocks.operators.discrete_derivator import DiscreteDerivator
+
+
+# ------------------------------------------------------------
+def run_chain_and_fused(num_delays, initial_output=None, dt=0.1, T=1.0):
+    m = Model()
+    src = Sinusoidal("src", amplitude=[[1.0], [2.0]], frequency=[[1.0], [0.5]])
+    delay = Delay("delay", num_delays=num_delays, initial_output=initial_output)
+    der = DiscreteDerivator("der")
+    fused = DelayedDerivator("fused", num_delays=num_delays, initial_output=initial_output)
+    for b in (src, delay, der, fused):
+        m.add_block(b)
+    m.connect("src", "out", "delay", "in")
+    m.connect("delay", "out", "der", "in")
+    m.connect("src", "out", "fused", "in")
+
+    sim_cfg = SimulationConfig(dt, T, logging=["der.outputs.out", "fused.outputs.out"])
+    sim = Simulator(m, sim_cfg)
+    logs = sim.run()
+    return np.array(logs["der.outputs.out"]), np.array(logs["fused.outputs.out"])
+
+
+# ------------------------------------------------------------
+@pytest.mark.parametrize("num_delays", [1, 3])
+def test_delayed_derivator_matches_delay_then_derivator(num_delays):
+    chain, fused = run_chain_and_fused(num_delays, initial_output=[[0.5], [-1.0]])
+
+    assert fused.shape == chain.shape
+    assert np.allclose(fused, chain)
+
+
+# ------------------------------------------------------------
+def test_delayed_derivator_scalar_initial_output_broadcast():
+    chain, fused = run_chain_and_fused(2, initial_output=1.0)
+
+    assert fused.shape[1:] == (2, 1)
+    assert np.allclose(fused, chain)
+
+
+# ------------------------------------------------------------
+def test_delayed_derivator_shape_mismatch_raises():
+    d = DelayedDerivator("D", num_delays=1, initial_output=[[1.0], [2.0]])
+    d.initialize(0.0)
+    d.inputs["in"] = np.zeros((3, 1))
+
+    with pytest.raises(ValueError) as err:
+        d.state_update(0.0, 0.1)
+
+    assert "shape" in str(err.value) and "expected" in str(err.value)
@@ -73,6 +73,27 @@ def test_integrator_scalar_backward():
     assert np.allclose(logs[2], [[0.2]])
 
 
+# ----------------------------------------------------------------------
+# 3b) TRAPEZOIDAL — SCALAR
+# ----------------------------------------------------------------------
+def test_integrator_scalar_trapezoidal():
+    src = Step("src", start_time=0.1, value_before=0.0, value_after=1.0)
+    I = DiscreteIntegrator("I", method="trapezoidal")
+
+    assert I.direct_feedthrough
+
+    logs = run_sim(src, I, dt=0.1, T=0.3)
+
+    # trapezoidal output: y = x + dt/2*u
+    # u: 0,1,1
+    # y0 = 0
+    # y1 = 0 + 0.05*1 = 0.05
+    # y2 = 0.1 + 0.05*1 = 0.15
+    assert np.allclose(logs[0], [[0.0]])
+    assert np.allclose(logs[1], [[0.05]])
+    assert np.allclose(logs[2], [[0.15]])
+
+
 # ----------------------------------------------------------------------
 # 4) INITIAL STATE — FREEZES SHAPE (NON-SCALAR)
 # ----------------------------------------------------------------------
@@ -147,3 +168,21 @@ def test_integrator_scalar_broadcast_into_frozen_matrix_shape():
     # backward: y = x + dt*u, with u broadcast to 2x2
     assert logs[0].shape == (2, 2)
     assert np.allclose(logs[0], 0.1 * 2.0 * np.ones((2, 2)))
+
+
+# ----------------------------------------------------------------------
+# 8) RERUN RESTARTS FROM THE INITIAL STATE
+# ----------------------------------------------------------------------
+def test_integrator_rerun_restarts_from_initial_state():
+    m = Model()
+    m.add_block(Constant("src", [[1.0], [2.0]]))
+    m.add_block(DiscreteIntegrator("I", initial_state=[[1.0], [0.0]]))
+    m.connect("src", "out", "I", "in")
+
+    sim = Simulator(m, SimulationConfig(0.1, 0.3, logging=["I.outputs.out"]))
+    first = np.array(sim.run()["I.outputs.out"])
+    second = np.array(sim.run()["I.outputs.out"])
+
+    assert np.allclose(first[0], [[1.0], [0.0]])
+    assert np.allclose(first[2], [[1.2], [0.4]])
+    assert np.allclose(first, second)
@@ -39,6 +39,32 @@ def test_gain_elementwise_vector_row_scaling():
     assert np.allclose(out, [[2.0], [3.0]])
 
 
+def test_gain_elementwise_vector_follows_set_params():
+    G = Gain("G", gain=[2.0, 3.0])
+    m = Model()
+    m.add_block(Constant("src", [[1.0], [1.0]]))
+    m.add_block(G)
+    m.connect("src", "out", "G", "in")
+    sim = Simulator(m, SimulationConfig(0.1, 0.1, logging=["G.outputs.out"]))
+    sim.run()
+
+    m.set_params({"G.gain": [4.0, 5.0]})
+    logs = sim.run()
+    assert np.allclose(logs["G.outputs.out"][-1], [[4.0], [5.0]])
+
+
+def test_gain_elementwise_vector_reassigned_during_run():
+    G = Gain("G", gain=[1.0, 2.0])
+    G.inputs["in"] = np.array([[1.0], [1.0]])
+    G.initialize(0.0)
+    G.output_update(0.0, 0.1)
+    assert np.allclose(G.outputs["out"], [[1.0], [2.0]])
+
+    setattr(G, "gain", np.array([50.0, 100.0]))
+    G.output_update(0.1, 0.1)
+    assert np.allclose(G.outputs["out"], [[50.0], [100.0]])
+
+
 def test_gain_elementwise_vector_bad_u_rows():
     g = Gain("G", gain=[1.0, 2.0])  # len=2, expects u.shape[0]==2
 
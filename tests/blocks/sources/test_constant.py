@@ -53,3 +53,36 @@ def test_constant_invalid_type():
 def test_constant_bad_shape():
     with pytest.raises(ValueError):
         Constant("c", value=np.zeros((2, 3, 2)))
+
+
+# ------------------------------------------------------------
+# 7) Sortie en lecture seule, rafraîchie à l'initialisation
+# ------------------------------------------------------------
+def test_constant_output_read_only_and_refreshed_on_initialize():
+    c = Constant("c", [[1.0], [2.0]])
+    c.initialize(0.0)
+    out = c.outputs["out"]
+    c.output_update(0.1, 0.1)
+    assert c.outputs["out"] is out
+    with pytest.raises(ValueError):
+        out[0, 0] = 0.0
+
+    c.value[0, 0] = 3.0
+    c.initialize(0.0)
+    assert np.allclose(c.outputs["out"], [[3.0], [2.0]])
+    assert np.allclose(out, [[1.0], [2.0]])
+
+
+# ------------------------------------------------------------
+# 8) Valeur réassignée en cours de simulation (curseur GUI)
+# ------------------------------------------------------------
+def test_constant_value_reassigned_during_run():
+    c = Constant("c", [[1.0], [1.0]])
+    c.initialize(0.0)
+    c.output_update(0.0, 0.1)
+    assert np.allclose(c.outputs["out"], [[1.0], [1.0]])
+
+    setattr(c, "value", [[5.0], [5.0]])
+    c.output_update(0.1, 0.1)
+    assert np.allclose(c.outputs["out"], [[5.0], [5.0]])
+    assert not c.outputs["out"].flags.writeable
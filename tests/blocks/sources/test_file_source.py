@@ -21,6 +21,23 @@ def test_file_source_npz_single_array(tmp_path: Path):
     assert np.allclose(blk.outputs["out"], [[3.0], [4.0]])
 
 
+def test_file_source_outputs_read_only_rows(tmp_path: Path):
+    path = tmp_path / "data.npy"
+    np.save(path, np.array([[1, 2], [3, 4]], dtype=np.int64))
+
+    blk = FileSource("src", file_path=str(path))
+    blk.initialize(0.0)
+    first = blk.outputs["out"]
+    blk.output_update(0.0, 0.1)
+    blk.output_update(0.1, 0.1)
+
+    assert first.dtype == np.float64
+    assert np.allclose(first, [[1.0], [2.0]])
+    assert np.allclose(blk.outputs["out"], [[3.0], [4.0]])
+    with pytest.raises(ValueError):
+        first[0, 0] = 0.0
+
+
 def test_file_source_npz_requires_key(tmp_path: Path):
     path = tmp_path / "data.npz"
     np.savez(path, a=np.array([1.0]), b=np.array([2.0]))
@@ -52,6 +69,14 @@ def test_file_source_csv(tmp_path: Path):
     assert np.allclose(blk.outputs["out"], [[4.0]])
 
 
+def test_file_source_csv_non_numeric_value(tmp_path: Path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1.0,2.0\n3.0,abc\n", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        FileSource("src", file_path=str(path), key="b")
+
+
 def test_file_source_repeat_false_outputs_zeros_after_end(tmp_path: Path):
     path = tmp_path / "data.npz"
     np.savez(path, y=np.array([[5.0], [7.0]]))
@@ -177,6 +202,14 @@ def test_file_source_npz_time_must_be_strictly_increasing(tmp_path: Path):
         FileSource("src", file_path=str(path), key="y", use_time=True)
 
 
+def test_file_source_npz_time_with_nan(tmp_path: Path):
+    path = tmp_path / "data.npz"
+    np.savez(path, time=np.array([0.0, np.nan, 0.4]), y=np.array([1.0, 2.0, 3.0]))
+
+    with pytest.raises(ValueError, match="NaN"):
+        FileSource("src", file_path=str(path), key="y", use_time=True)
+
+
 def test_file_source_csv_use_time_requires_time_column(tmp_path: Path):
     path = tmp_path / "data.csv"
     path.write_text("y\n1.0\n2.0\n", encoding="utf-8")
@@ -33,6 +33,23 @@ def test_step_matrix_same_shape():
     assert np.allclose(s.outputs["out"], va)
 
 
+def test_step_output_not_aliasing_user_values():
+    vb = np.array([[0.0]])
+    va = np.array([[1.0]])
+    s = Step("s", vb, va, start_time=1.0)
+
+    s.initialize(0.0)
+    s.output_update(2.0, 0.1)
+    out = s.outputs["out"]
+    s.output_update(3.0, 0.1)
+
+    assert s.outputs["out"] is out
+    assert not out.flags.writeable
+    assert va.flags.writeable
+    with pytest.raises(ValueError):
+        out[0, 0] = 5.0
+
+
 def test_step_scalar_broadcast_to_matrix_before():
     # value_before scalar, value_after matrix -> broadcast before
     vb = 0.0
@@ -74,3 +91,27 @@ def test_step_bad_start_time_type():
 def test_step_bad_ndim():
     with pytest.raises(ValueError):
         Step("s", np.zeros((2, 2, 2)), 1.0, start_time=1.0)
+
+
+def test_step_values_reassigned_during_run():
+    s = Step("s", 0.0, 1.0, start_time=1.0)
+    s.initialize(0.0)
+
+    setattr(s, "value_before", np.array([[3.0]]))
+    s.output_update(0.5, 0.1)
+    assert np.allclose(s.outputs["out"], [[3.0]])
+
+    setattr(s, "value_after", np.array([[7.0]]))
+    s.output_update(1.5, 0.1)
+    assert np.allclose(s.outputs["out"], [[7.0]])
+
+
+def test_step_start_time_reassigned_during_run():
+    s = Step("s", 0.0, 1.0, start_time=1.0)
+    s.initialize(0.0)
+
+    s.start_time = 2.0
+    s.output_update(1.5, 0.1)
+    assert np.allclose(s.outputs["out"], [[0.0]])
+    s.output_update(2.0, 0.1)
+    assert np.allclose(s.outputs["out"], [[1.0]])
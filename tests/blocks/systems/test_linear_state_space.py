@@ -77,6 +77,73 @@ def test_lss_vector_dims():
     assert np.allclose(y[2], [[0.2]])
 
 
+# ------------------------------------------------------------
+def test_lss_batched_columns_match_single_runs():
+    A = [[1.0, 0.1],
+         [-0.2, 0.9]]
+    B = [[0.0],
+         [1.0]]
+    C = [[1.0, 0.0]]
+    x0 = np.array([[0.0, 1.0, -1.0],
+                   [0.0, 0.5, 2.0]])
+
+    # shared (1,1) input broadcast to the three trajectories
+    logs = run_sim(Constant("u", [[2.0]]), LinearStateSpace("sys", A=A, B=B, C=C, x0=x0))
+    y = np.array(logs["sys.outputs.y"])
+    assert y.shape[1:] == (1, 3)
+
+    for j in range(3):
+        single = run_sim(Constant("u", [[2.0]]), LinearStateSpace("sys", A=A, B=B, C=C, x0=x0[:, [j]]))
+        assert np.allclose(y[:, :, j], np.array(single["sys.outputs.y"])[:, :, 0])
+
+    # one input column per trajectory (m=3, N=3)
+    B3 = [[1.0, 0.0, 0.0],
+          [0.0, 1.0, 1.0]]
+    U = np.arange(9.0).reshape(3, 3)
+    logs = run_sim(Constant("u", U), LinearStateSpace("sys", A=A, B=B3, C=C, x0=x0))
+    x = np.array(logs["sys.outputs.x"])
+    assert np.allclose(x[1], np.array(A) @ x0 + np.array(B3) @ U)
+
+
+# ------------------------------------------------------------
+def test_lss_batched_rejects_wrong_input_columns():
+    # N=3 trajectories, m=2 inputs, u given with 2 columns
+    sys = LinearStateSpace("sys", A=[[1.0]], B=[[1.0, 1.0]], C=[[1.0]], x0=[[0.0, 0.0, 0.0]])
+
+    with pytest.raises(ValueError) as err:
+        run_sim(Constant("u", np.eye(2)), sys)
+
+    assert "must have shape" in str(err.value)
+
+    # wrong row count still reports both accepted batch shapes
+    sys = LinearStateSpace("sys", A=[[1.0]], B=[[1.0, 1.0]], C=[[1.0]], x0=[[0.0, 0.0, 0.0]])
+    with pytest.raises(ValueError) as err:
+        run_sim(Constant("u", np.ones((3, 3))), sys)
+
+    assert "(2,1) or (2,3)" in str(err.value)
+
+
+# ------------------------------------------------------------
+def test_lss_rerun_restarts_from_x0_with_new_params():
+    src = Constant("u", [[1.0]])
+    sys = LinearStateSpace("sys", A=[[0.9]], B=[[1.0]], C=[[1.0]], x0=[[0.5]])
+
+    m = Model()
+    m.add_block(src)
+    m.add_block(sys)
+    m.connect("u", "out", "sys", "u")
+    sim = Simulator(m, SimulationConfig(0.1, 0.3, logging=["sys.outputs.y"]))
+
+    first = np.array(sim.run()["sys.outputs.y"])
+    second = np.array(sim.run()["sys.outputs.y"])
+    assert np.allclose(first, second)
+
+    m.set_params({"sys.A": [[0.5]]})
+    y = sim.run()["sys.outputs.y"]
+    assert np.allclose(y[0], [[0.5]])
+    assert np.allclose(y[1], [[0.5 * 0.5 + 1.0]])
+
+
 # ------------------------------------------------------------
 def test_lss_missing_input_raises():
     A = [[1.0]]
@@ -80,3 +80,116 @@ def test_determinism_same_model_same_logs(capsys):
     assert len(logs1["p.outputs.y"]) == len(logs2["p.outputs.y"])
     for v1, v2 in zip(logs1["p.outputs.y"], logs2["p.outputs.y"]):
         assert np.allclose(v1, v2)
+
+
+def test_run_logs_match_stepwise_logging(capsys):
+    """
+    Logs recorded by run() must match those appended step by step with _log(),
+    and get_data() must return them as one (n_steps, *shape) array.
+    """
+    cfg = SimulationConfig(dt=0.01, T=0.05, t0=0.0, solver="fixed", logging=["p.outputs.y"])
+
+    m = Model(name="log_buffer_test")
+    m.add_block(PureSource("s", value=3.0))
+    m.add_block(RequiresInput("p"))
+    m.connect("s", "y", "p", "u")
+
+    sim = Simulator(model=m, sim_cfg=cfg, verbose=False)
+    logs = sim.run()
+    data = sim.get_data("p.outputs.y")
+
+    sim.initialize(0.0)
+    while sim.t_step < cfg.T - 1e-12:
+        sim.step()
+        sim._log(cfg.logging)
+
+    assert isinstance(logs["p.outputs.y"], list)
+    n_steps = len(sim.logs["time"])
+    assert len(logs["time"]) == n_steps
+    for v1, v2 in zip(logs["time"], sim.logs["time"]):
+        assert np.allclose(v1, v2)
+    assert data.shape == (n_steps, 1, 1)
+    assert np.allclose(data, np.array(sim.logs["p.outputs.y"]))
+
+
+def test_log_dtype_float32(capsys):
+    cfg = SimulationConfig(dt=0.01, T=0.05, t0=0.0, solver="fixed",
+                           logging=["p.outputs.y"], log_dtype="float32")
+
+    m = Model(name="log_dtype_test")
+    m.add_block(PureSource("s", value=1.0 / 3.0))
+    m.add_block(RequiresInput("p"))
+    m.connect("s", "y", "p", "u")
+
+    sim = Simulator(model=m, sim_cfg=cfg, verbose=False)
+    logs = sim.run()
+
+    assert sim.get_data("p.outputs.y").dtype == np.float32
+    assert logs["p.outputs.y"][0].dtype == np.float32
+    assert sim.get_data("time").dtype == np.float64
+    assert np.allclose(sim.get_data("p.outputs.y"), 1.0 / 3.0)
+
+
+class MixedDtypeSource(Block):
+    """Emits a float sample at t=0, then integer samples."""
+
+    def initialize(self, t0: float):
+        self.outputs["y"] = np.array([[0.5]])
+
+    def output_update(self, t: float, dt: float):
+        k = int(round(t * 100))
+        self.outputs["y"] = np.array([[0.5]]) if k == 0 else np.array([[k]])
+
+    def state_update(self, t: float, dt: float):
+        pass
+
+
+def test_log_narrower_dtype_is_cast_without_regrowing(monkeypatch):
+    calls = []
+    grow = Simulator._grow_buffer
+
+    def counting_grow(buf, k, dtype):
+        calls.append(k)
+        return grow(buf, k, dtype)
+
+    monkeypatch.setattr(Simulator, "_grow_buffer", staticmethod(counting_grow))
+
+    m = Model(name="mixed_dtype")
+    m.add_block(MixedDtypeSource("s"))
+    sim = Simulator(m, SimulationConfig(dt=0.01, T=0.05, logging=["s.outputs.y"]), verbose=False)
+    sim.run()
+
+    data = sim.get_data("s.outputs.y")
+    assert data.dtype == np.float64
+    assert data[0, 0, 0] == 0.5
+    assert np.allclose(data[1:, 0, 0], np.arange(1, data.shape[0]))
+    assert calls == []
+
+
+def test_invalid_log_dtype_raises():
+    cfg = SimulationConfig(dt=0.01, T=0.05, log_dtype="float16")
+    with pytest.raises(ValueError):
+        cfg.validate()
+
+
+def test_set_params_rerun_matches_fresh_model(capsys):
+    cfg = SimulationConfig(dt=0.01, T=0.03, t0=0.0, solver="fixed", logging=["p.outputs.y"])
+
+    m = Model(name="set_params_test")
+    m.add_block(PureSource("s", value=2.0))
+    m.add_block(RequiresInput("p"))
+    m.connect("s", "y", "p", "u")
+    sim = Simulator(model=m, sim_cfg=cfg, verbose=False)
+    sim.run()
+
+    m.set_params({"s.value": 5.0})
+    logs = sim.run()
+
+    assert all(np.allclose(v, [[5.0]]) for v in logs["p.outputs.y"])
+
+    with pytest.raises(ValueError):
+        m.set_params({"s.value": [1.0, 2.0]})
+    with pytest.raises(ValueError):
+        m.set_params({"s._unknown": 1.0})
+    with pytest.raises(ValueError):
+        m.set_params({"missing.value": 1.0})
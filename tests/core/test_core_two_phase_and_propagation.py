@@ -130,3 +130,24 @@ def test_two_phase_outputs_vs_state_commit(capsys):
 
     assert len(y) == len(x) >= 3
     assert np.allclose(x, y + 1.0)
+
+
+def test_execution_order_cached_until_topology_changes():
+    """
+    The execution order is computed once and reused until a block or a
+    connection is added to the model.
+    """
+    m = Model(name="order_cache_test")
+    m.add_block(SourceSetsOne("src"))
+    m.add_block(PassThrough("dst"))
+
+    order = m.execution_order()
+    assert m.execution_order() is order
+
+    m.connect("src", "y", "dst", "u")
+    order = m.execution_order()
+    assert [b.name for b in order] == ["src", "dst"]
+    assert m.execution_order() is order
+
+    m.add_block(PassThrough("dst2"))
+    assert [b.name for b in m.execution_order()] == ["src", "dst2", "dst"]